@@ -1,6 +1,7 @@
 """Matplotlib-based chart renderer."""
 
 import io
+import base64
 from typing import Optional, Tuple
 import pandas as pd
 import numpy as np
@@ -8,6 +9,7 @@ import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from scipy import stats
 
 from ..models.data_models import ChartConfig, SeriesStyle, Theme, Annotation
@@ -18,6 +20,8 @@ class MatplotlibRenderer:
     
     def __init__(self):
         self.figure: Optional[Figure] = None
+        # Figure released by close(), cleared and reused by the next render
+        self._spare_figure: Optional[Figure] = None
     
     def render(
         self,
@@ -33,20 +37,14 @@ class MatplotlibRenderer:
         self._apply_theme(theme)
         
         # Create figure
-        fig = plt.figure(
-            figsize=(config.figure_width, config.figure_height),
-            dpi=config.dpi,
-        )
+        fig = self._new_figure(config)
         
         # Create axes
         ax1 = fig.add_subplot(111)
         ax2 = None
         
         # Check if we need secondary axis
-        has_secondary = any(
-            s.y_axis == "secondary" and s.visible 
-            for s in config.series_styles
-        )
+        has_secondary = config.has_secondary_axis
         
         if has_secondary and config.y_axis_secondary:
             ax2 = ax1.twinx()
@@ -133,6 +131,25 @@ class MatplotlibRenderer:
         self.figure = fig
         return fig, metadata
     
+    def _new_figure(self, config: ChartConfig) -> Figure:
+        """Get an empty figure for config, reusing the spare one if there is one."""
+        fig, self._spare_figure = self._spare_figure, None
+        if fig is None:
+            fig = Figure()
+            FigureCanvasAgg(fig)
+        else:
+            fig.clf()
+            # clf() keeps figure-level settings, so reset them from the current theme
+            fig.set_facecolor(plt.rcParams['figure.facecolor'])
+            fig.set_edgecolor(plt.rcParams['figure.edgecolor'])
+            fig.subplotpars.update(
+                **{k: plt.rcParams[f'figure.subplot.{k}'] for k in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')}
+            )
+        
+        fig.set_size_inches(config.figure_width, config.figure_height)
+        fig.set_dpi(config.dpi)
+        return fig
+    
     def _apply_theme(self, theme: Theme) -> None:
         """Apply theme to matplotlib."""
         if theme.mode == "dark":
@@ -613,8 +630,26 @@ class MatplotlibRenderer:
         
         buf = io.BytesIO()
         self.figure.savefig(buf, format=format, dpi=dpi, bbox_inches='tight')
-        buf.seek(0)
-        return buf.read()
+        return buf.getvalue()
+    
+    def save_to_base64(self, format: str = "png", dpi: int = 100,
+                       compress_level: Optional[int] = None) -> str:
+        """Save figure as base64 text, encoding straight from the write buffer.
+        
+        compress_level (0-9) trades PNG size for encode time, e.g. 1 for previews.
+        """
+        if self.figure is None:
+            return ""
+        
+        kwargs = {}
+        if compress_level is not None and format == "png":
+            kwargs["pil_kwargs"] = {"compress_level": compress_level}
+        
+        buf = io.BytesIO()
+        self.figure.savefig(buf, format=format, dpi=dpi, bbox_inches='tight', **kwargs)
+        # getbuffer() is a view, so the PNG is never copied into a bytes object
+        with buf.getbuffer() as view:
+            return base64.b64encode(view).decode('ascii')
     
     def save_to_file(self, file_path: str, dpi: int = 100) -> None:
         """Save figure to file."""
@@ -624,8 +659,8 @@ class MatplotlibRenderer:
         self.figure.savefig(file_path, dpi=dpi, bbox_inches='tight')
     
     def close(self) -> None:
-        """Close figure and free memory."""
+        """Release the current figure; the next render clears and reuses it."""
         if self.figure is not None:
-            plt.close(self.figure)
+            self._spare_figure = self.figure
             self.figure = None
 
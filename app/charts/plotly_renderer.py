@@ -38,10 +38,7 @@ class PlotlyRenderer:
         warnings = []
         
         # Check if we need secondary axis
-        has_secondary = any(
-            s.y_axis == "secondary" and s.visible 
-            for s in config.series_styles
-        )
+        has_secondary = config.has_secondary_axis
         
         # Create figure
         if has_secondary:
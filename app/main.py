@@ -174,6 +174,7 @@ class GraphCreatorApp:
             on_change=self._on_config_change,
             on_load_example=self._load_example,
             on_import_data=self._import_data,
+            on_chart_change=self._on_chart_change,
         )
         
         self.canvas = Canvas(
@@ -290,10 +291,16 @@ class GraphCreatorApp:
         # Update page to show changes
         self.page.update()
     
+    def _on_chart_change(self):
+        """Handle a change that only affects the chart."""
+        # The sidebar is unchanged, and render() updates the canvas itself
+        self.canvas.render()
+    
     def _refresh_ui(self):
         """Refresh entire UI."""
         self.canvas.render()
-        self.builder.refresh()
+        # One page update carries the rebuilt sidebar
+        self.builder.refresh(batch=True)
         self.page.update()
     
     def _load_example(self, example_type: str):
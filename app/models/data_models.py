@@ -1,12 +1,79 @@
 """Data models for the graph creator application."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal, Tuple
 from datetime import datetime
+import base64
+import sys
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pyarrow = None
 
-@dataclass
+
+def _df_to_arrow_b64(df: pd.DataFrame) -> Optional[str]:
+    """Encode df as a base64 Arrow IPC stream, or None if pyarrow is missing or cannot store it."""
+    if not PYARROW_AVAILABLE or not all(isinstance(col, str) for col in df.columns):
+        return None
+    
+    try:
+        table = pyarrow.Table.from_pandas(df)
+    except (ValueError, TypeError, pyarrow.ArrowException):
+        # e.g. duplicate column names or mixed-type object columns
+        return None
+    
+    sink = pyarrow.BufferOutputStream()
+    options = pyarrow.ipc.IpcWriteOptions(compression="lz4")
+    with pyarrow.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode("ascii")
+
+
+def _df_from_arrow_b64(payload: str) -> pd.DataFrame:
+    """Decode a base64 Arrow IPC stream written by _df_to_arrow_b64."""
+    reader = pyarrow.ipc.open_stream(pyarrow.BufferReader(base64.b64decode(payload)))
+    # Consolidating into pandas-owned blocks keeps the columns writable for in-place cell edits
+    return reader.read_all().to_pandas()
+
+
+def _df_to_raw_columns(df: pd.DataFrame) -> Optional[List[Dict[str, str]]]:
+    """Encode plain numpy columns as base64 raw bytes, or None if df holds anything else."""
+    if not (len(df.columns) and df.index.equals(pd.RangeIndex(len(df)))
+            and all(isinstance(col, str) for col in df.columns)):
+        return None
+    if not all(isinstance(dt, np.dtype) and dt.kind in "biufM" for dt in df.dtypes):
+        return None
+    
+    columns = []
+    for i, col in enumerate(df.columns):
+        values = np.ascontiguousarray(df.iloc[:, i].to_numpy())
+        columns.append({
+            "name": col,
+            "dtype": values.dtype.str,
+            "data": base64.b64encode(values).decode("ascii"),
+        })
+    return columns
+
+
+def _df_from_raw_columns(columns: List[Dict[str, str]]) -> pd.DataFrame:
+    """Decode columns written by _df_to_raw_columns."""
+    arrays = [
+        np.frombuffer(base64.b64decode(column["data"]), dtype=np.dtype(column["dtype"]))
+        for column in columns
+    ]
+    # Build from positional arrays so the frame owns writable copies, even with repeated names
+    df = pd.DataFrame(dict(enumerate(arrays)), copy=True)
+    df.columns = [column["name"] for column in columns]
+    return df
+
+
+@dataclass(slots=True)
 class DataSource:
     """Represents a data source with its metadata."""
     
@@ -18,9 +85,19 @@ class DataSource:
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
+        # Arrow IPC when possible: columnar and far faster than a dict of rows
+        arrow = _df_to_arrow_b64(self.df)
+        raw = _df_to_raw_columns(self.df) if arrow is None else None
+        if arrow is not None:
+            data = {"arrow": arrow}
+        elif raw is not None:
+            # Without pyarrow, plain numeric frames still skip per-value JSON encoding
+            data = {"columns": raw}
+        else:
+            data = {"data": self.df.to_dict(orient="split")}
         return {
             "name": self.name,
-            "data": self.df.to_dict(orient="split"),
+            **data,
             "source_type": self.source_type,
             "created_at": self.created_at.isoformat(),
             "version": self.version,
@@ -29,7 +106,14 @@ class DataSource:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DataSource":
         """Deserialize from dictionary."""
-        df = pd.DataFrame(**data["data"])
+        if "arrow" in data:
+            if not PYARROW_AVAILABLE:
+                raise ImportError("This project stores its data in Arrow format; install pyarrow to open it")
+            df = _df_from_arrow_b64(data["arrow"])
+        elif "columns" in data:
+            df = _df_from_raw_columns(data["columns"])
+        else:
+            df = pd.DataFrame(**data["data"])
         return cls(
             name=data["name"],
             df=df,
@@ -39,7 +123,7 @@ class DataSource:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Transform:
     """Represents a data transformation."""
     
@@ -61,7 +145,7 @@ class Transform:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class SeriesStyle:
     """Style configuration for a single series."""
     
@@ -97,7 +181,7 @@ class SeriesStyle:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class AxisConfig:
     """Axis configuration."""
     
@@ -125,7 +209,7 @@ class AxisConfig:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Annotation:
     """Chart annotation."""
     
@@ -147,7 +231,7 @@ class Annotation:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Theme:
     """Visual theme configuration."""
     
@@ -156,14 +240,18 @@ class Theme:
     font_family: str = "sans-serif"
     font_size: float = 11.0
     title_font_size: float = 14.0
-    color_palette: List[str] = field(default_factory=lambda: [
+    color_palette: Tuple[str, ...] = (
         "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
         "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"
-    ])
+    )
     background_color: str = "#ffffff"
     grid_color: str = "#e0e0e0"
     text_color: str = "#000000"
     
+    def __post_init__(self):
+        """Store the palette as a tuple of interned hex strings shared across themes."""
+        self.color_palette = tuple(sys.intern(color) for color in self.color_palette)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -172,7 +260,7 @@ class Theme:
             "font_family": self.font_family,
             "font_size": self.font_size,
             "title_font_size": self.title_font_size,
-            "color_palette": self.color_palette,
+            "color_palette": list(self.color_palette),
             "background_color": self.background_color,
             "grid_color": self.grid_color,
             "text_color": self.text_color,
@@ -184,7 +272,7 @@ class Theme:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChartConfig:
     """Complete chart configuration."""
     
@@ -207,6 +295,11 @@ class ChartConfig:
     figure_height: float = 6.0
     dpi: int = 100
     
+    @property
+    def has_secondary_axis(self) -> bool:
+        """Check if any visible series is plotted on the secondary Y axis."""
+        return any(s.y_axis == "secondary" and s.visible for s in self.series_styles)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -247,7 +340,7 @@ class ChartConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectState:
     """Complete project state for serialization."""
     
@@ -1,8 +1,12 @@
 """Application state management with undo/redo support."""
 
-from typing import List, Optional, Callable
+from typing import Any, List, Optional, Callable, Union
 from dataclasses import dataclass, field
 import copy
+import pickle
+import queue
+import threading
+import numpy as np
 import pandas as pd
 
 from .data_models import (
@@ -29,6 +33,141 @@ def _default_dark_theme():
     )
 
 
+@dataclass
+class CellEdit:
+    """Undo entry for a single data cell edit."""
+    row: int
+    col: int
+    old: Any
+    new: Any
+    # Original column values, kept only when the edit changed the column dtype
+    old_values: Optional[np.ndarray] = None
+    # Column dtype after the edit, kept alongside old_values so redo reproduces it
+    new_dtype: Optional[Any] = None
+    
+    def apply(self, target) -> None:
+        """Redo the edit on target (an AppState or ProjectState)."""
+        df = target.data_source.df
+        if self.new_dtype is not None and df.dtypes.iat[self.col] != self.new_dtype:
+            df.isetitem(self.col, df.iloc[:, self.col].astype(self.new_dtype))
+        df.iat[self.row, self.col] = self.new
+    
+    def revert(self, target) -> None:
+        """Undo the edit on target (an AppState or ProjectState)."""
+        df = target.data_source.df
+        if self.old_values is not None:
+            df.isetitem(self.col, self.old_values.copy())
+        else:
+            df.iat[self.row, self.col] = self.old
+
+
+def _resolve_path(target, path: str):
+    """Resolve a dotted field path to (container, key).
+    
+    Segments are attribute names, list indices or dict keys, e.g.
+    "chart_config.series_styles.0.label" or "chart_config.annotations.1.params.y".
+    """
+    *parents, key = path.split(".")
+    obj = target
+    for part in parents:
+        if isinstance(obj, list):
+            obj = obj[int(part)]
+        elif isinstance(obj, dict):
+            obj = obj[part]
+        else:
+            obj = getattr(obj, part)
+    
+    if isinstance(obj, list):
+        return obj, int(key)
+    return obj, key
+
+
+def _get_path(target, path: str) -> Any:
+    """Get the value at a dotted field path."""
+    obj, key = _resolve_path(target, path)
+    if isinstance(obj, list):
+        return obj[key]
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key)
+
+
+def _set_path(target, path: str, value: Any) -> None:
+    """Set the value at a dotted field path."""
+    obj, key = _resolve_path(target, path)
+    if isinstance(obj, (list, dict)):
+        obj[key] = value
+    else:
+        setattr(obj, key, value)
+
+
+@dataclass
+class FieldEdit:
+    """Undo entry for a single config field edit."""
+    path: str
+    old: Any
+    new: Any
+    
+    def apply(self, target) -> None:
+        """Redo the edit on target (an AppState or ProjectState)."""
+        _set_path(target, self.path, self.new)
+    
+    def revert(self, target) -> None:
+        """Undo the edit on target (an AppState or ProjectState)."""
+        _set_path(target, self.path, self.old)
+
+
+@dataclass
+class ColumnRename:
+    """Undo entry for a data column rename and the config fields that followed it."""
+    col: int
+    old: str
+    new: str
+    # Dotted paths of config fields that referenced the column by name
+    paths: List[str] = field(default_factory=list)
+    
+    def _rename(self, target, name: str) -> None:
+        """Set the column label by position in place and point the paths at it."""
+        df = target.data_source.df
+        cols = df.columns.to_numpy(copy=True)
+        cols[self.col] = name
+        df.columns = pd.Index(cols)
+        for path in self.paths:
+            _set_path(target, path, name)
+    
+    def apply(self, target) -> None:
+        """Redo the rename on target (an AppState or ProjectState)."""
+        self._rename(target, self.new)
+    
+    def revert(self, target) -> None:
+        """Undo the rename on target (an AppState or ProjectState)."""
+        self._rename(target, self.old)
+
+
+# History entries that are replayed against a full snapshot
+EDIT_TYPES = (CellEdit, FieldEdit, ColumnRename)
+
+# Edit entries that change the df in place
+DF_EDIT_TYPES = (CellEdit, ColumnRename)
+
+
+def _clone(obj: Any) -> Any:
+    """Deep copy plain config objects via a pickle round trip, faster than deepcopy."""
+    return pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+
+
+def _snapshot_worker(jobs: queue.Queue) -> None:
+    """Fill in frozen df copies for queued snapshots, in order."""
+    while True:
+        target, df, share = jobs.get()
+        try:
+            target.df = share.df if share is not None else df.copy()
+        except Exception as e:
+            print(f"Snapshot copy error: {e}")
+        finally:
+            jobs.task_done()
+
+
 @dataclass
 class AppState:
     """Main application state with undo/redo support."""
@@ -45,9 +184,17 @@ class AppState:
     auto_render: bool = True
     
     # History for undo/redo
-    _history: List[ProjectState] = field(default_factory=list, init=False, repr=False)
+    _history: List[Union[ProjectState, CellEdit, FieldEdit, ColumnRename]] = field(default_factory=list, init=False, repr=False)
     _history_index: int = field(default=-1, init=False, repr=False)
     _max_history: int = field(default=50, init=False, repr=False)
+    # (live df, snapshot DataSource holding its frozen copy); reused while the df is unchanged
+    _snapshot_df: Optional[tuple] = field(default=None, init=False, repr=False)
+    # Frozen df copies are made on a background thread; see _queue_df_copy
+    _snap_queue: Optional[queue.Queue] = field(default=None, init=False, repr=False)
+    # Bumped on every in-place change of the live df, see data_version
+    _data_version: int = field(default=0, init=False, repr=False)
+    # Config part name -> (pickled bytes, frozen copy) from the last snapshot, see _snapshot_part
+    _snapshot_parts: dict = field(default_factory=dict, init=False, repr=False)
     
     # Change listeners
     _listeners: List[Callable] = field(default_factory=list, init=False, repr=False)
@@ -69,28 +216,176 @@ class AppState:
             except Exception as e:
                 print(f"Error in listener: {e}")
     
-    def save_snapshot(self) -> None:
-        """Save current state to history."""
-        # Remove any history after current index
-        self._history = self._history[:self._history_index + 1]
+    def _queue_df_copy(self, target: DataSource, df: Optional[pd.DataFrame] = None,
+                       share: Optional[DataSource] = None) -> None:
+        """Fill target.df on the snapshot thread, copying df or sharing share.df."""
+        if self._snap_queue is None:
+            self._snap_queue = queue.Queue(maxsize=4)
+            threading.Thread(target=_snapshot_worker, args=(self._snap_queue,), daemon=True).start()
+        # Blocks while the queue is full, so at most a few copies are ever pending
+        self._snap_queue.put((target, df, share))
+    
+    def sync_snapshots(self) -> None:
+        """Wait until queued snapshot copies are done."""
+        if self._snap_queue is not None:
+            self._snap_queue.join()
+    
+    def begin_df_edit(self) -> None:
+        """Prepare for an in-place change of the live df.
         
-        # Create snapshot
-        snapshot = ProjectState(
-            data_source=copy.deepcopy(self.data_source),
-            transforms=copy.deepcopy(self.transforms),
-            chart_config=copy.deepcopy(self.chart_config),
-            theme=copy.deepcopy(self.theme),
+        Waits for pending snapshot copies of it and stops sharing its frozen copy.
+        """
+        self.sync_snapshots()
+        self._snapshot_df = None
+        self._data_version += 1
+    
+    @property
+    def data_version(self) -> int:
+        """Counter of in-place df changes; with the df's identity it fingerprints the data."""
+        return self._data_version
+    
+    def _snapshot_data_source(self) -> Optional[DataSource]:
+        """Copy the data source, sharing the frozen df with the last snapshot if unchanged."""
+        if self.data_source is None:
+            return None
+        
+        # Deep copy everything else now; the df is filled in by the snapshot thread
+        df = self.data_source.df
+        snapshot = copy.deepcopy(self.data_source, memo={id(df): None})
+        if self._snapshot_df is not None and self._snapshot_df[0] is df:
+            self._queue_df_copy(snapshot, share=self._snapshot_df[1])
+        else:
+            self._queue_df_copy(snapshot, df=df)
+        self._snapshot_df = (df, snapshot)
+        return snapshot
+    
+    def _snapshot_part(self, name: str) -> Any:
+        """Freeze a config part, sharing the last snapshot's copy if it is unchanged."""
+        data = pickle.dumps(getattr(self, name), pickle.HIGHEST_PROTOCOL)
+        last = self._snapshot_parts.get(name)
+        if last is not None and last[0] == data:
+            return last[1]
+        
+        frozen = pickle.loads(data)
+        self._snapshot_parts[name] = (data, frozen)
+        return frozen
+    
+    def _create_snapshot(self) -> ProjectState:
+        """Create a deep copy of the current state."""
+        return ProjectState(
+            data_source=self._snapshot_data_source(),
+            transforms=self._snapshot_part("transforms"),
+            chart_config=self._snapshot_part("chart_config"),
+            theme=self._snapshot_part("theme"),
         )
+    
+    def _push_history(self, entry: Union[ProjectState, CellEdit, FieldEdit, ColumnRename]) -> None:
+        """Append a history entry after the current index."""
+        # Remove any history after current index
+        self._history = self._history[:self._history_index + 1]
         
         # Add to history
-        self._history.append(snapshot)
+        self._history.append(entry)
         
         # Limit history size
         if len(self._history) > self._max_history:
-            self._history.pop(0)
+            oldest = self._history.pop(0)
+            # The new oldest entry must be a full snapshot to restore from
+            if isinstance(self._history[0], EDIT_TYPES):
+                if isinstance(self._history[0], DF_EDIT_TYPES):
+                    self.sync_snapshots()
+                    # Snapshots may share their frozen df; edit a private copy
+                    oldest.data_source = copy.copy(oldest.data_source)
+                    oldest.data_source.df = oldest.data_source.df.copy()
+                # Config parts may be shared with newer snapshots too
+                for name in ("transforms", "chart_config", "theme"):
+                    setattr(oldest, name, _clone(getattr(oldest, name)))
+                self._history[0].apply(oldest)
+                self._history[0] = oldest
         else:
             self._history_index += 1
     
+    def save_snapshot(self) -> None:
+        """Save current state to history."""
+        self._push_history(self._create_snapshot())
+    
+    def record_cell_diff(
+        self,
+        row: int,
+        col: int,
+        old: Any,
+        new: Any,
+        old_values: Optional[np.ndarray] = None,
+        merge: bool = False,
+    ) -> None:
+        """Record an already applied cell edit as a lightweight undo entry.
+        
+        With merge, a repeated edit of the same cell updates the newest entry
+        instead of adding a new undo step.
+        """
+        # The df changed in place, so the next snapshot needs a fresh copy
+        self.begin_df_edit()
+        
+        last = self._history[-1] if self._history else None
+        if (merge and isinstance(last, CellEdit) and (last.row, last.col) == (row, col)
+                and self._history_index == len(self._history) - 1):
+            last.new = new
+            if last.old_values is None and old_values is not None:
+                # old_values predates only this edit; put back the burst's original value
+                old_values[row] = last.old
+                last.old_values = old_values
+            if last.old_values is not None:
+                last.new_dtype = self.data_source.df.dtypes.iat[col]
+            return
+        
+        new_dtype = self.data_source.df.dtypes.iat[col] if old_values is not None else None
+        self._push_history(CellEdit(row, col, old, new, old_values, new_dtype))
+    
+    def record_edit(self, path: str, old: Any, new: Any, merge: bool = False) -> None:
+        """Record an already applied config field edit as a lightweight undo entry.
+        
+        path is a dotted field path such as "chart_config.x_axis.min_value".
+        With merge, a repeated edit of the same field updates the newest entry
+        instead of adding a new undo step.
+        """
+        last = self._history[-1] if self._history else None
+        if (merge and isinstance(last, FieldEdit) and last.path == path
+                and self._history_index == len(self._history) - 1):
+            last.new = new
+            return
+        
+        self._push_history(FieldEdit(path, old, new))
+    
+    def rename_column(self, col: int, new: str) -> None:
+        """Rename a data column in place as one undo step.
+        
+        Series and the X column that referenced the old name follow the rename.
+        """
+        self.begin_df_edit()
+        
+        old = self.data_source.df.columns[col]
+        paths = [
+            f"chart_config.series_styles.{i}.column"
+            for i, series in enumerate(self.chart_config.series_styles)
+            if series.column == old
+        ]
+        if self.chart_config.x_column == old:
+            paths.append("chart_config.x_column")
+        
+        entry = ColumnRename(col, old, new, paths)
+        entry.apply(self)
+        self._push_history(entry)
+    
+    def set_field(self, path: str, value: Any, merge: bool = False) -> bool:
+        """Set a config field and record the edit. Returns False for a no-op."""
+        old = _get_path(self, path)
+        if old == value:
+            return False
+        
+        _set_path(self, path, value)
+        self.record_edit(path, old, value, merge=merge)
+        return True
+    
     def can_undo(self) -> bool:
         """Check if undo is available."""
         return self._history_index > 0
@@ -101,38 +396,68 @@ class AppState:
     
     def undo(self) -> bool:
         """Undo last change."""
+        self.sync_snapshots()
         if not self.can_undo():
             return False
         
+        entry = self._history[self._history_index]
         self._history_index -= 1
-        self._restore_from_history()
+        if isinstance(entry, EDIT_TYPES):
+            if isinstance(entry, DF_EDIT_TYPES):
+                self.begin_df_edit()
+            entry.revert(self)
+        else:
+            self._restore_from_history()
         self._notify_listeners()
         return True
     
     def redo(self) -> bool:
         """Redo last undone change."""
+        self.sync_snapshots()
         if not self.can_redo():
             return False
         
         self._history_index += 1
-        self._restore_from_history()
+        entry = self._history[self._history_index]
+        if isinstance(entry, EDIT_TYPES):
+            if isinstance(entry, DF_EDIT_TYPES):
+                self.begin_df_edit()
+            entry.apply(self)
+        else:
+            self._restore_from_history()
         self._notify_listeners()
         return True
     
     def _restore_from_history(self) -> None:
         """Restore state from history at current index."""
         if 0 <= self._history_index < len(self._history):
-            snapshot = self._history[self._history_index]
+            # Start from the nearest full snapshot and replay edits after it
+            base = self._history_index
+            while isinstance(self._history[base], EDIT_TYPES):
+                base -= 1
+            
+            snapshot = self._history[base]
             self.data_source = copy.deepcopy(snapshot.data_source)
-            self.transforms = copy.deepcopy(snapshot.transforms)
-            self.chart_config = copy.deepcopy(snapshot.chart_config)
-            self.theme = copy.deepcopy(snapshot.theme)
+            self.transforms = _clone(snapshot.transforms)
+            self.chart_config = _clone(snapshot.chart_config)
+            self.theme = _clone(snapshot.theme)
+            
+            # The restored df matches the snapshot's frozen one until a df edit replays
+            self._snapshot_df = None
+            if self.data_source is not None:
+                self._snapshot_df = (self.data_source.df, snapshot.data_source)
+            
+            for edit in self._history[base + 1:self._history_index + 1]:
+                edit.apply(self)
+                if isinstance(edit, DF_EDIT_TYPES):
+                    self._snapshot_df = None
     
     def get_transformed_data(self) -> Optional[pd.DataFrame]:
         """Get data after applying all enabled transforms."""
         if self.data_source is None:
             return None
         
+        # One deep copy keeps the result clear of in-place cell edits; transforms copy shallowly
         df = self.data_source.df.copy()
         
         # Import here to avoid circular dependency
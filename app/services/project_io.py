@@ -1,40 +1,127 @@
 """Project save/load functionality."""
 
 import json
+import os
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
+
+import numpy as np
 
 from ..models.data_models import ProjectState
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+    pl = None
+
+# Below this row count the pandas -> polars conversion costs more than the faster writer saves
+POLARS_CSV_MIN_ROWS = 10_000
+
+
+@contextmanager
+def _atomic_open(file_path: str, mode: str = 'w', **kwargs):
+    """Open a temp file that replaces file_path only once fully written."""
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Leave any existing file at file_path untouched
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _encode_project(data: dict, df=None) -> bytes:
+    """Encode project data as indented JSON, with orjson when available.
+    
+    orjson writes NaN and infinities as null, so split-dict frames holding any
+    keep stdlib json. The arrow and raw-column layouts hold no float literals.
+    """
+    source = data.get("data_source")
+    split_dict = source is not None and "data" in source
+    if ORJSON_AVAILABLE and not (split_dict and _has_non_finite(df)):
+        return orjson.dumps(
+            data,
+            default=str,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME),
+        )
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+def _has_non_finite(df) -> bool:
+    """Check numeric columns for NaN or +/-inf."""
+    values = df.select_dtypes('number').to_numpy(dtype=float, na_value=np.nan)
+    return not np.isfinite(values).all()
+
 
 class ProjectIO:
     """Handles project file I/O."""
     
     @staticmethod
-    def save_project(project: ProjectState, file_path: str) -> None:
-        """Save project to .graphproj file."""
+    def save_project(project: ProjectState, file_path: Union[str, BinaryIO]) -> None:
+        """Save project to a .graphproj file or a binary file-like object."""
         data = project.to_dict()
+        df = project.data_source.df if project.data_source is not None else None
+        payload = _encode_project(data, df)
+        
+        if hasattr(file_path, 'write'):
+            file_path.write(payload)
+            return
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        # A failed save never leaves a truncated project behind
+        with _atomic_open(file_path, 'wb') as f:
+            f.write(payload)
     
     @staticmethod
-    def load_project(file_path: str) -> ProjectState:
-        """Load project from .graphproj file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def load_project(file_path: Union[str, BinaryIO]) -> ProjectState:
+        """Load project from a .graphproj file or a binary file-like object."""
+        if hasattr(file_path, 'read'):
+            raw = file_path.read()
+        else:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        
+        data = None
+        if ORJSON_AVAILABLE:
+            # Files written by stdlib json may hold NaN/Infinity, which orjson rejects
+            with suppress(orjson.JSONDecodeError):
+                data = orjson.loads(raw)
+        if data is None:
+            data = json.loads(raw)
         
         return ProjectState.from_dict(data)
     
     @staticmethod
-    def export_data_csv(file_path: str, df) -> None:
-        """Export DataFrame to CSV."""
-        if df is not None:
+    def export_data_csv(file_path: Union[str, BinaryIO], df) -> None:
+        """Export DataFrame to CSV at a path or into a file-like object."""
+        if df is None:
+            return
+        
+        # polars formats numbers natively; other dtypes would be written differently
+        if (POLARS_AVAILABLE and len(df) >= POLARS_CSV_MIN_ROWS and df.columns.is_unique
+                and all(isinstance(dt, np.dtype) and dt.kind in "iuf" for dt in df.dtypes)):
+            pl.from_pandas(df, nan_to_null=True).write_csv(file_path)
+        else:
             df.to_csv(file_path, index=False)
     
     @staticmethod
-    def export_data_json(file_path: str, df) -> None:
-        """Export DataFrame to JSON."""
+    def export_data_json(file_path: Union[str, BinaryIO], df) -> None:
+        """Export DataFrame to JSON at a path or into a file-like object."""
         if df is not None:
             df.to_json(file_path, orient='records', indent=2)
 
@@ -1,42 +1,208 @@
 """Data transformation engine."""
 
-from typing import Any, Dict
+import ast
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
-from scipy import stats
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+    pl = None
+
+try:
+    import numexpr
+    from numexpr.necompiler import getExprNames
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+    numexpr = None
+    getExprNames = None
+
+# Below this row count the pandas <-> polars conversion costs more than it saves
+POLARS_MIN_ROWS = 10_000
+
+# Operators numexpr evaluates exactly like pandas for NUMEXPR_SERIES_DTYPES; %, **,
+# shifts and function calls are left out because their numexpr semantics differ
+ARITHMETIC_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+COMPARISON_OPS = (ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+
+# numexpr upcasts narrower ints and float32 where pandas keeps them
+NUMEXPR_SERIES_DTYPES = frozenset({np.dtype(np.int64), np.dtype(np.float64)})
+
+# Column dtypes whose polars results match pandas in value and dtype
+POLARS_DTYPES = frozenset({np.dtype(np.int64), np.dtype(np.float64)})
+
+# column_math operation -> ufunc folded left to right over the operand columns
+COLUMN_MATH_UFUNCS = {
+    "add": np.add,
+    "subtract": np.subtract,
+    "multiply": np.multiply,
+    "divide": np.divide,
+}
+
+
+def _interp_linear(values: np.ndarray) -> np.ndarray:
+    """Fill NaN gaps in values in place the way ``Series.interpolate()`` does.
+    
+    Leading NaNs stay missing and trailing NaNs take the last valid value.
+    """
+    missing = np.isnan(values)
+    if not missing.any() or missing.all():
+        return values
+    
+    positions = np.flatnonzero(missing)
+    known = np.flatnonzero(~missing)
+    positions = positions[positions > known[0]]
+    values[positions] = np.interp(positions, known, values[known])
+    return values
+
+
+@lru_cache(maxsize=128)
+def _numexpr_names(query: str) -> Optional[Tuple[str, ...]]:
+    """Get the names an expression references, or None if numexpr cannot parse it."""
+    try:
+        names, _ = getExprNames(query, {})
+    except Exception:
+        return None
+    return tuple(names)
+
+
+@lru_cache(maxsize=128)
+def _compile_expression(expression: str):
+    """Compile a computed-series expression once per distinct string."""
+    return compile(expression, "<expression>", "eval")
+
+
+def _is_arithmetic(node: ast.AST) -> bool:
+    """Check that a node is +, -, *, / over names and numeric constants."""
+    if isinstance(node, ast.BinOp):
+        return isinstance(node.op, ARITHMETIC_OPS) and _is_arithmetic(node.left) and _is_arithmetic(node.right)
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.UAdd, ast.USub)) and _is_arithmetic(node.operand)
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, (int, float)) and not isinstance(node.value, bool)
+    return isinstance(node, ast.Name)
+
+
+def _is_comparison(node: ast.AST) -> bool:
+    """Check that a node is a single comparison of two arithmetic operands."""
+    # Chained comparisons are an error on Series
+    return (isinstance(node, ast.Compare) and len(node.ops) == 1
+            and isinstance(node.ops[0], COMPARISON_OPS)
+            and _is_arithmetic(node.left) and _is_arithmetic(node.comparators[0]))
+
+
+def _is_condition(node: ast.AST) -> bool:
+    """Check that a node is comparisons combined with &, | and ~."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+        return _is_condition(node.left) and _is_condition(node.right)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+        return _is_condition(node.operand)
+    return _is_comparison(node)
+
+
+def _parse_expression(expression: str) -> Optional[ast.AST]:
+    """Parse an expression to its body node, or None on a syntax error."""
+    try:
+        return ast.parse(expression, mode="eval").body
+    except SyntaxError:
+        return None
+
+
+@lru_cache(maxsize=128)
+def _is_plain_arithmetic(expression: str) -> bool:
+    """Check that a computed-series expression only uses syntax numexpr and pandas evaluate alike."""
+    node = _parse_expression(expression)
+    return node is not None and (_is_arithmetic(node) or _is_comparison(node))
+
+
+@lru_cache(maxsize=128)
+def _is_plain_condition(query: str) -> bool:
+    """Check that a filter query only uses syntax numexpr and ``DataFrame.query`` evaluate alike."""
+    node = _parse_expression(query)
+    return node is not None and _is_condition(node)
 
 
 class TransformEngine:
     """Engine for applying data transformations."""
     
+    # Transform type -> handler method, dispatched by apply_transform
+    TRANSFORM_METHODS = {
+        "column_math": "_column_math",
+        "normalize": "_normalize",
+        "smooth": "_smooth",
+        "resample": "_resample",
+        "interpolate": "_interpolate",
+        "filter": "_filter",
+        "group": "_group",
+        "computed_series": "_computed_series",
+        "rolling": "_rolling",
+        "diff": "_diff",
+        "pct_change": "_pct_change",
+    }
+    
+    def __init__(self, use_polars: bool = True):
+        # Polars is only used when installed and the frame is large enough
+        self.use_polars = use_polars and POLARS_AVAILABLE
+    
+    def _polars_enabled(self, df: pd.DataFrame) -> bool:
+        """Check whether the polars path should be used for this frame."""
+        return self.use_polars and len(df) >= POLARS_MIN_ROWS
+    
+    def _numeric_columns(self, df: pd.DataFrame, columns: List[str]) -> List[str]:
+        """Get the requested columns that exist and are numeric, without duplicates."""
+        return [
+            col for col in dict.fromkeys(columns)
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col])
+        ]
+    
+    def _polars_columns(self, df: pd.DataFrame, columns: List[str]) -> Optional[List[str]]:
+        """Get the numeric columns to hand to polars, or None to use the pandas path.
+        
+        Only int64/float64 columns go to polars; bool, narrower and extension
+        dtypes either fail there or come back with a different dtype.
+        """
+        if not self._polars_enabled(df):
+            return None
+        
+        numeric_cols = self._numeric_columns(df, columns)
+        if not all(df[col].dtype in POLARS_DTYPES for col in numeric_cols):
+            return None
+        return numeric_cols
+    
+    def _polars_with_columns(self, df: pd.DataFrame, columns: List[str], exprs: list) -> pd.DataFrame:
+        """Evaluate polars expressions over columns and write them back into a shallow copy of df."""
+        frame = pl.from_pandas(df[columns], rechunk=False)
+        out = frame.lazy().select(exprs).collect()
+        
+        result = df.copy(deep=False)
+        for col in out.columns:
+            # Plain numpy keeps dtypes compatible with the pandas path (nulls become NaN)
+            result[col] = out[col].to_numpy()
+        
+        return result
+    
     def apply_transform(self, df: pd.DataFrame, transform: Any) -> pd.DataFrame:
-        """Apply a transform to a dataframe."""
+        """Apply a transform to a dataframe.
+        
+        Handlers only ever replace whole columns, so the result is a shallow
+        copy that shares untouched column buffers with df.
+        """
         transform_type = transform.transform_type
-        params = transform.params
-        
-        method_map = {
-            "column_math": self._column_math,
-            "normalize": self._normalize,
-            "smooth": self._smooth,
-            "resample": self._resample,
-            "interpolate": self._interpolate,
-            "filter": self._filter,
-            "group": self._group,
-            "computed_series": self._computed_series,
-            "rolling": self._rolling,
-            "diff": self._diff,
-            "pct_change": self._pct_change,
-        }
-        
-        method = method_map.get(transform_type)
+        
+        method = self.TRANSFORM_METHODS.get(transform_type)
         if method is None:
             raise ValueError(f"Unknown transform type: {transform_type}")
         
-        return method(df, params)
+        return getattr(self, method)(df, transform.params)
     
     def _column_math(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Perform column math operations."""
-        result = df.copy()
+        result = df.copy(deep=False)
         operation = params.get("operation", "add")
         columns = params.get("columns", [])
         new_column = params.get("new_column", "result")
@@ -44,32 +210,54 @@ class TransformEngine:
         if len(columns) < 2:
             return result
         
+        ufunc = COLUMN_MATH_UFUNCS.get(operation)
+        if ufunc is None:
+            return result
+        
+        # Missing operands are skipped, except the first one of a non-add operation
+        cols = [col for col in columns[1:] if col in df.columns]
+        if operation != "add" or columns[0] in df.columns:
+            cols.insert(0, columns[0])
+        if not cols:
+            result[new_column] = 0
+            return result
+        
+        if all(isinstance(dt, np.dtype) and dt.kind in "iuf" for dt in df.dtypes[cols]):
+            # Fold the raw arrays into one output buffer, skipping pandas per-op overhead
+            arrays = [df[col].to_numpy() for col in cols]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out = arrays[0].copy() if len(arrays) == 1 else ufunc(arrays[0], arrays[1])
+                for values in arrays[2:]:
+                    if np.result_type(out, values) == out.dtype:
+                        ufunc(out, values, out=out)
+                    else:
+                        out = ufunc(out, values)
+            result[new_column] = out
+            return result
+        
+        # Bool, nullable and object columns keep pandas semantics; adding
+        # starts from 0 so bool operands are counted rather than OR-ed
         if operation == "add":
-            result[new_column] = sum(df[col] for col in columns if col in df.columns)
-        elif operation == "subtract":
-            result[new_column] = df[columns[0]]
-            for col in columns[1:]:
-                if col in df.columns:
-                    result[new_column] -= df[col]
-        elif operation == "multiply":
-            result[new_column] = df[columns[0]]
-            for col in columns[1:]:
-                if col in df.columns:
-                    result[new_column] *= df[col]
-        elif operation == "divide":
-            result[new_column] = df[columns[0]]
-            for col in columns[1:]:
-                if col in df.columns:
-                    result[new_column] /= df[col]
+            out = sum(df[col] for col in cols)
+        else:
+            out = df[cols[0]]
+            for col in cols[1:]:
+                out = ufunc(out, df[col])
+        result[new_column] = out
         
         return result
     
     def _normalize(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Normalize columns."""
-        result = df.copy()
         method = params.get("method", "min-max")
         columns = params.get("columns", [])
         
+        polars_cols = self._polars_columns(df, columns)
+        if polars_cols is not None:
+            return self._normalize_polars(df, method, polars_cols)
+        
+        result = df.copy(deep=False)
+        
         for col in columns:
             if col not in df.columns:
                 continue
@@ -77,13 +265,21 @@ class TransformEngine:
             if not pd.api.types.is_numeric_dtype(df[col]):
                 continue
             
-            if method == "min-max":
-                min_val = df[col].min()
-                max_val = df[col].max()
-                if max_val > min_val:
-                    result[col] = (df[col] - min_val) / (max_val - min_val)
-            elif method == "z-score":
-                result[col] = stats.zscore(df[col].dropna())
+            if method in ("min-max", "z-score"):
+                values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                valid = values[~np.isnan(values)]
+                if not len(valid):
+                    continue
+                if method == "min-max":
+                    min_val = valid.min()
+                    spread = valid.max() - min_val
+                    if spread <= 0:
+                        continue
+                    scaled = (values - min_val) * (1.0 / spread)
+                else:
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        scaled = (values - valid.mean()) * (1.0 / valid.std())
+                result[col] = self._like_source_dtype(scaled, df[col])
             elif method == "robust":
                 median = df[col].median()
                 iqr = df[col].quantile(0.75) - df[col].quantile(0.25)
@@ -92,9 +288,45 @@ class TransformEngine:
         
         return result
     
+    def _like_source_dtype(self, values: np.ndarray, source: pd.Series):
+        """Cast float64 results back to the dtype pandas arithmetic on source gives.
+        
+        Float columns (numpy or nullable) keep their dtype, nullable integers
+        become Float64 and everything else stays float64.
+        """
+        dtype = source.dtype
+        if isinstance(dtype, np.dtype):
+            return values.astype(dtype) if dtype.kind == "f" else values
+        if dtype.kind in "iuf":
+            target = dtype if dtype.kind == "f" else pd.Float64Dtype()
+            return pd.Series(values, index=source.index).astype(target)
+        return values
+    
+    def _normalize_polars(self, df: pd.DataFrame, method: str, columns: List[str]) -> pd.DataFrame:
+        """Normalize columns using polars expressions."""
+        if not columns:
+            return df.copy(deep=False)
+        
+        exprs = []
+        for col in columns:
+            c = pl.col(col)
+            if method == "min-max":
+                spread = c.max() - c.min()
+                exprs.append(pl.when(spread > 0).then((c - c.min()) / spread).otherwise(c).alias(col))
+            elif method == "z-score":
+                exprs.append(((c - c.mean()) / c.std(ddof=0)).alias(col))
+            elif method == "robust":
+                iqr = c.quantile(0.75, interpolation="linear") - c.quantile(0.25, interpolation="linear")
+                exprs.append(pl.when(iqr > 0).then((c - c.median()) / iqr).otherwise(c).alias(col))
+        
+        if not exprs:
+            return df.copy(deep=False)
+        
+        return self._polars_with_columns(df, columns, exprs)
+    
     def _smooth(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Apply smoothing to columns."""
-        result = df.copy()
+        result = df.copy(deep=False)
         method = params.get("method", "rolling_mean")
         window = params.get("window", 3)
         columns = params.get("columns", [])
@@ -107,6 +339,7 @@ class TransformEngine:
                 continue
             
             if method == "rolling_mean":
+                # pandas' rolling mean is compensated, so large values don't swamp later windows
                 result[col] = df[col].rolling(window=window, center=True).mean()
             elif method == "rolling_median":
                 result[col] = df[col].rolling(window=window, center=True).median()
@@ -124,7 +357,7 @@ class TransformEngine:
         if date_column not in df.columns:
             return df
         
-        result = df.copy()
+        result = df.copy(deep=False)
         result[date_column] = pd.to_datetime(result[date_column])
         result = result.set_index(date_column)
         
@@ -141,16 +374,24 @@ class TransformEngine:
     
     def _interpolate(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Interpolate missing values."""
-        result = df.copy()
+        result = df.copy(deep=False)
         method = params.get("method", "linear")
-        columns = params.get("columns", [])
-        
-        for col in columns:
-            if col not in df.columns:
-                continue
-            
-            if pd.api.types.is_numeric_dtype(df[col]):
-                result[col] = df[col].interpolate(method=method)
+        columns = self._numeric_columns(df, params.get("columns", []))
+        
+        if method == "linear":
+            # Linear fill of float columns is a single np.interp call over the gaps
+            rest = []
+            for col in columns:
+                dtype = df[col].dtype
+                if isinstance(dtype, np.dtype) and dtype.kind == "f":
+                    result[col] = _interp_linear(df[col].to_numpy(copy=True))
+                else:
+                    rest.append(col)
+            columns = rest
+        
+        if columns:
+            # One frame-level call instead of one interpolate per column
+            result[columns] = df[columns].interpolate(method=method, axis=0)
         
         return result
     
@@ -161,11 +402,64 @@ class TransformEngine:
         if not query:
             return df
         
+        if NUMEXPR_AVAILABLE:
+            mask = self._numexpr_mask(df, query)
+            if mask is not None:
+                return df[mask]
+        
         try:
             return df.query(query)
         except Exception:
             return df
     
+    def _numexpr_mask(self, df: pd.DataFrame, query: str) -> Optional[np.ndarray]:
+        """Evaluate a filter query directly with numexpr, skipping the pandas parser.
+        
+        Returns None when the query uses syntax or columns numexpr cannot handle,
+        so the caller can fall back to ``DataFrame.query``.
+        """
+        if not _is_plain_condition(query):
+            return None
+        
+        mask = self._numexpr_evaluate(df, query, "if", NUMEXPR_SERIES_DTYPES)
+        if mask is None or mask.dtype != np.bool_:
+            return None
+        
+        return mask
+    
+    def _numexpr_evaluate(self, df: pd.DataFrame, expression: str, kinds: str,
+                          dtypes: Optional[frozenset] = None) -> Optional[np.ndarray]:
+        """Evaluate an expression over df columns with numexpr, one value per row.
+        
+        Returns None unless every name is a column whose dtype kind is in kinds
+        (and whose dtype is in dtypes, if given) and numexpr can evaluate the
+        expression.
+        """
+        names = _numexpr_names(expression)
+        if not names:
+            return None
+        
+        local_dict = {}
+        for name in names:
+            if name not in df.columns:
+                return None
+            values = df[name].to_numpy()
+            if values.ndim != 1 or values.dtype.kind not in kinds:
+                return None
+            if dtypes is not None and values.dtype not in dtypes:
+                return None
+            local_dict[name] = values
+        
+        try:
+            out = numexpr.evaluate(expression, local_dict=local_dict)
+        except Exception:
+            return None
+        
+        if out.shape != (len(df),):
+            return None
+        
+        return out
+    
     def _group(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Group and aggregate data."""
         group_by = params.get("group_by", [])
@@ -187,6 +481,13 @@ class TransformEngine:
         if not numeric_cols:
             return df
         
+        if agg_func in ("mean", "sum", "count", "min", "max") and self._is_sorted_key(df, group_by, numeric_cols):
+            return self._group_sorted(df, group_by[0], numeric_cols, agg_func)
+        
+        if (agg_func in ("mean", "sum", "count", "min", "max")
+                and self._polars_columns(df, numeric_cols) is not None):
+            return self._group_polars(df, group_by, numeric_cols, agg_func)
+        
         if agg_func == "mean":
             result = df.groupby(group_by)[numeric_cols].mean().reset_index()
         elif agg_func == "sum":
@@ -202,15 +503,93 @@ class TransformEngine:
         
         return result
     
+    def _is_sorted_key(self, df: pd.DataFrame, group_by: List[str], numeric_cols: List[str]) -> bool:
+        """Check whether a single, already-sorted key allows a segmented reduce."""
+        if len(group_by) != 1:
+            return False
+        
+        key = df[group_by[0]]
+        # Extension dtypes (categoricals, nullable ints) keep pandas' own semantics
+        if not isinstance(key.dtype, np.dtype) or key.hasnans:
+            return False
+        if not all(isinstance(df[col].dtype, np.dtype) for col in numeric_cols):
+            return False
+        
+        return key.is_monotonic_increasing
+    
+    def _group_sorted(self, df: pd.DataFrame, key_col: str, numeric_cols: List[str], agg_func: str) -> pd.DataFrame:
+        """Aggregate contiguous runs of a sorted key without hashing."""
+        key = df[key_col]
+        if len(key) == 0:
+            return df.groupby(key_col)[numeric_cols].agg(agg_func).reset_index()
+        
+        keys = key.to_numpy()
+        starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+        
+        result = {key_col: key.iloc[starts].reset_index(drop=True)}
+        for col in numeric_cols:
+            values = df[col].to_numpy()
+            missing = pd.isna(values) if values.dtype.kind == "f" else None
+            
+            if agg_func in ("min", "max"):
+                # fmin/fmax skip NaN like pandas does
+                reducer = np.fmin if agg_func == "min" else np.fmax
+                result[col] = reducer.reduceat(values, starts)
+                continue
+            
+            if missing is not None:
+                counts = np.add.reduceat(~missing, starts).astype(np.int64)
+                sums = np.add.reduceat(np.where(missing, 0.0, values), starts)
+            else:
+                counts = np.diff(np.append(starts, len(values))).astype(np.int64)
+                sums = np.add.reduceat(values, starts)
+            
+            if agg_func == "sum":
+                result[col] = sums
+            elif agg_func == "count":
+                result[col] = counts
+            else:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    means = sums / np.where(counts > 0, counts, np.nan)
+                # pandas keeps float32 means as float32
+                result[col] = means.astype(values.dtype) if missing is not None else means
+        
+        return pd.DataFrame(result)
+    
+    def _group_polars(self, df: pd.DataFrame, group_by: List[str], numeric_cols: List[str], agg_func: str) -> pd.DataFrame:
+        """Group and aggregate using polars, matching pandas' sorted, NaN-dropping groupby."""
+        agg = getattr(pl.col(numeric_cols), agg_func)()
+        if agg_func == "count":
+            agg = agg.cast(pl.Int64)
+        
+        out = (
+            pl.from_pandas(df[group_by + numeric_cols], rechunk=False)
+            .lazy()
+            .drop_nulls(group_by)
+            .group_by(group_by)
+            .agg(agg)
+            .sort(group_by)
+            .collect()
+        )
+        
+        return pd.DataFrame({col: out[col].to_numpy() for col in out.columns})
+    
     def _computed_series(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Create computed series using expression."""
-        result = df.copy()
+        result = df.copy(deep=False)
         expression = params.get("expression", "")
         new_column = params.get("new_column", "computed")
         
         if not expression:
             return result
         
+        if NUMEXPR_AVAILABLE and _is_plain_arithmetic(expression):
+            # Plain arithmetic over int64/float64 columns runs as one fused numexpr pass
+            values = self._numexpr_evaluate(df, expression, "if", NUMEXPR_SERIES_DTYPES)
+            if values is not None:
+                result[new_column] = values
+                return result
+        
         try:
             # Create safe namespace for eval
             namespace = {
@@ -224,7 +603,7 @@ class TransformEngine:
                 namespace[col] = df[col]
             
             # Evaluate expression
-            result[new_column] = eval(expression, {"__builtins__": {}}, namespace)
+            result[new_column] = eval(_compile_expression(expression), {"__builtins__": {}}, namespace)
         except Exception as e:
             print(f"Expression error: {e}")
         
@@ -232,11 +611,20 @@ class TransformEngine:
     
     def _rolling(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Apply rolling window operations."""
-        result = df.copy()
         window = params.get("window", 3)
         operation = params.get("operation", "mean")
         columns = params.get("columns", [])
         
+        polars_cols = self._polars_columns(df, columns)
+        if polars_cols is not None and operation in ("mean", "median", "sum", "std", "min", "max"):
+            exprs = [
+                getattr(pl.col(col), f"rolling_{operation}")(window_size=window).alias(col)
+                for col in polars_cols
+            ]
+            return self._polars_with_columns(df, polars_cols, exprs)
+        
+        result = df.copy(deep=False)
+        
         for col in columns:
             if col not in df.columns:
                 continue
@@ -263,25 +651,41 @@ class TransformEngine:
     
     def _diff(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Calculate difference between consecutive rows."""
-        result = df.copy()
         periods = params.get("periods", 1)
         columns = params.get("columns", [])
         
-        for col in columns:
-            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-                result[col] = df[col].diff(periods=periods)
+        polars_cols = self._polars_columns(df, columns)
+        if polars_cols is not None:
+            exprs = [pl.col(col).diff(n=periods).alias(col) for col in polars_cols]
+            return self._polars_with_columns(df, polars_cols, exprs)
+        
+        result = df.copy(deep=False)
+        numeric_cols = self._numeric_columns(df, columns)
+        
+        if numeric_cols:
+            result[numeric_cols] = df[numeric_cols].diff(periods=periods)
         
         return result
     
     def _pct_change(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
         """Calculate percentage change between consecutive rows."""
-        result = df.copy()
         periods = params.get("periods", 1)
         columns = params.get("columns", [])
         
-        for col in columns:
-            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-                result[col] = df[col].pct_change(periods=periods) * 100
+        polars_cols = self._polars_columns(df, columns)
+        if polars_cols is not None:
+            # pandas pads gaps before computing the change (fill_method="pad")
+            exprs = [
+                (pl.col(col).forward_fill().pct_change(n=periods) * 100).alias(col)
+                for col in polars_cols
+            ]
+            return self._polars_with_columns(df, polars_cols, exprs)
+        
+        result = df.copy(deep=False)
+        numeric_cols = self._numeric_columns(df, columns)
+        
+        if numeric_cols:
+            result[numeric_cols] = df[numeric_cols].pct_change(periods=periods) * 100
         
         return result
 
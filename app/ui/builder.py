@@ -1,31 +1,226 @@
 """Builder sidebar UI component."""
 
 import flet as ft
+import time
+from contextlib import contextmanager
+from functools import partial
 from typing import Callable, Optional
 import pandas as pd
 
 from ..models.state import AppState
 from ..models.data_models import SeriesStyle, AxisConfig, Annotation, Transform
 from .components import Section, LabeledControl, ColorPicker
+from .debounce import Debouncer
+
+
+# Data editor rows are virtualized: a fixed row extent lets the ListView skip
+# laying out offscreen rows, and rows are only built as the user scrolls to them
+EDITOR_ROW_EXTENT = 39  # 35px cell + 2px padding on each side
+EDITOR_ROW_BATCH = 20
+# Rows kept as live widgets around the viewport; rows scrolled further away
+# are swapped for empty placeholders and rebuilt when scrolled back to
+EDITOR_ROW_WINDOW = 100
+# Rows added per UI update while the first batch is filled in the background
+EDITOR_ROW_CHUNK = 5
+
+# Milliseconds of inactivity before a slider drag or a typing burst is
+# committed (snapshot + re-render)
+SLIDER_DEBOUNCE_MS = 150
+TEXT_DEBOUNCE_MS = 250
+
+# Edits to the same field or cell closer together than this share one undo entry
+SNAPSHOT_COALESCE_S = 0.5
+
+
+# (value, label) choices for the static dropdowns. Flet controls can only have
+# one parent, so each dropdown gets its own Option instances built from these.
+CHART_TYPE_CHOICES = (
+    ("line", "Line"),
+    ("area", "Area"),
+    ("bar", "Bar"),
+    ("stacked_bar", "Stacked Bar"),
+    ("bar_100", "100% Bar"),
+    ("scatter", "Scatter"),
+    ("step", "Step"),
+    ("histogram", "Histogram"),
+    ("kde", "KDE"),
+    ("box", "Box Plot"),
+    ("violin", "Violin Plot"),
+)
+
+LINE_STYLE_CHOICES = (
+    ("solid", "Solid"),
+    ("dashed", "Dashed"),
+    ("dotted", "Dotted"),
+    ("dashdot", "Dash-Dot"),
+)
+
+MARKER_CHOICES = (
+    ("", "None"),
+    ("o", "Circle"),
+    ("s", "Square"),
+    ("^", "Triangle Up"),
+    ("v", "Triangle Down"),
+    ("D", "Diamond"),
+    ("*", "Star"),
+    ("+", "Plus"),
+    ("x", "X"),
+)
+
+Y_AXIS_CHOICES = (
+    ("primary", "Primary"),
+    ("secondary", "Secondary"),
+)
+
+SCALE_CHOICES = (
+    ("linear", "Linear"),
+    ("log", "Logarithmic"),
+)
+
+LEGEND_CHOICES = (
+    ("best", "Best"),
+    ("upper right", "Upper Right"),
+    ("upper left", "Upper Left"),
+    ("lower left", "Lower Left"),
+    ("lower right", "Lower Right"),
+    ("none", "None"),
+)
+
+ANNOTATION_TYPE_CHOICES = (
+    ("hline", "Horizontal Line"),
+    ("vline", "Vertical Line"),
+    ("text", "Text Label"),
+    ("span", "Horizontal Span"),
+    ("band", "Vertical Band"),
+)
+
+THEME_MODE_CHOICES = (
+    ("light", "Light"),
+    ("dark", "Dark"),
+)
+
+
+# Editable parameters per annotation type: (key, label, type, default, field width)
+ANNOTATION_PARAM_FIELDS = {
+    "hline": (("y", "Y Value", float, 0, 100), ("color", "Color", str, "red", 100)),
+    "vline": (("x", "X Value", float, 0, 100), ("color", "Color", str, "red", 100)),
+    "text": (("text", "Text", str, "", None), ("x", "X", float, 0, 80), ("y", "Y", float, 0, 80)),
+    "span": (("xmin", "X Min", float, 0, 80), ("xmax", "X Max", float, 1, 80), ("color", "Color", str, "yellow", 100)),
+    "band": (("ymin", "Y Min", float, 0, 80), ("ymax", "Y Max", float, 1, 80), ("color", "Color", str, "gray", 100)),
+}
+
+
+# Shared look of sidebar text fields and dropdowns, splatted into each control
+_FIELD_STYLE = dict(
+    content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
+    bgcolor=ft.colors.SURFACE_VARIANT,
+    color=ft.colors.ON_SURFACE,
+    border_color=ft.colors.OUTLINE,
+)
+_DROPDOWN_STYLE = dict(_FIELD_STYLE, content_padding=ft.padding.symmetric(horizontal=10, vertical=8))
+
+
+def _dropdown_options(choices) -> list:
+    """Build fresh dropdown options from (value, label) pairs."""
+    return [ft.dropdown.Option(value, label) for value, label in choices]
+
+
+def _fmt_optional(value) -> str:
+    """Show an optional config value in a text field, None as empty."""
+    return "" if value is None else str(value)
+
+
+def _parse_float(text: str) -> Optional[float]:
+    """Parse a typed number, or None while the text is not one yet (e.g. "-")."""
+    try:
+        return float(text)
+    except ValueError:
+        return None
 
 
 class Builder(ft.Container):
     """Left sidebar builder panel."""
     
+    # Series field -> handler, dispatched from control.data = (field, series)
+    SERIES_FIELD_HANDLERS = {
+        "visible": "_on_series_visible_change",
+        "column": "_on_series_column_change",
+        "label": "_on_series_label_change",
+        "color": "_on_series_color_change",
+        "line_width": "_on_series_width_change",
+        "line_style": "_on_series_style_change",
+        "marker": "_on_series_marker_change",
+        "marker_size": "_on_series_marker_size_change",
+        "alpha": "_on_series_alpha_change",
+        "y_axis": "_on_series_axis_change",
+    }
+    
     def __init__(
         self,
         state: AppState,
         on_change: Callable,
         on_load_example: Callable,
         on_import_data: Callable,
+        on_chart_change: Optional[Callable] = None,
         **kwargs
     ):
         self.state = state
+        # on_change follows edits that rebuilt sidebar sections; on_chart_change
+        # follows edits that only affect the rendered chart
         self.on_change = on_change
+        self.on_chart_change = on_chart_change or on_change
         self.on_load_example = on_load_example
         self.on_import_data = on_import_data
         self.page = None  # Will be set by parent
         
+        # Transformed data memoized for one build pass (see _get_df)
+        self._cached_df = None
+        
+        # (df, numeric column names) for the last frame seen by _numeric_columns
+        self._numeric_cols_cache = None
+        
+        # Debounced commits for sliders and text fields, keyed per field
+        self._debouncer = Debouncer()
+        
+        # Bumped on each data editor build so stale background fills stop
+        self._preview_token = 0
+        self._preview_done_token = 0
+        
+        # Last coalesced field or cell edit, see _should_coalesce
+        self._last_snapshot_key = None
+        self._last_snapshot_time = 0.0
+        
+        # Column of annotation rows, kept by _build_annotations_section for in-place edits
+        self._annotations_list = None
+        
+        # (value, label) column choices for dropdowns, filled by _build_series_section
+        self._column_choices = []
+        
+        # Column of series rows, kept by _build_series_section for in-place edits
+        self._series_list = None
+        
+        # (swatch, color field) by id() of their series, filled by _build_series_control
+        self._series_swatches = {}
+        
+        # Data source series were last auto-created for, see _auto_create_series
+        self._auto_series_source = None
+        
+        # Nesting depth of _suspend_updates and the control updates it deferred
+        self._updates_suspended = 0
+        self._deferred_updates = []
+        
+        # (title, builder) pairs for the sidebar sections, in order
+        self._section_builders = (
+            ("Data Sources", self._build_data_section),
+            ("Data Editor", self._build_data_preview_section),
+            ("Chart Type", self._build_chart_type_section),
+            ("Series", self._build_series_section),
+            ("Axes & Scales", self._build_axes_section),
+            ("Layout & Labels", self._build_layout_section),
+            ("Annotations", self._build_annotations_section),
+            ("Theme & Styling", self._build_theme_section),
+        )
+        
         # Track section expansion states
         self.section_expanded = {
             0: True,   # Data Sources
@@ -38,17 +233,9 @@ class Builder(ft.Container):
             7: False,  # Theme & Styling
         }
         
-        # Create scrollable column for sections (stores reference for dynamic updates)
-        self.sections_column = ft.Column([
-            self._build_data_section(),
-            self._build_data_preview_section(),
-            self._build_chart_type_section(),
-            self._build_series_section(),
-            self._build_axes_section(),
-            self._build_layout_section(),
-            self._build_annotations_section(),
-            self._build_theme_section(),
-        ], spacing=10, scroll=ft.ScrollMode.AUTO)
+        # Create scrollable list of sections (stores reference for dynamic updates).
+        # This is the only vertical scroll region besides the data editor rows.
+        self.sections_column = ft.ListView(self._build_sections(), spacing=10, expand=True)
         
         # Build UI
         content = ft.Column([
@@ -86,6 +273,26 @@ class Builder(ft.Container):
             ], spacing=0),
         ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
     
+    def _build_sections(self) -> list:
+        """Build all sections; collapsed ones defer their content until expanded."""
+        # Series creation must not wait for the Series section to be opened
+        self._auto_create_series()
+        return [
+            self._build_lazy_section(index, title, build)
+            for index, (title, build) in enumerate(self._section_builders)
+        ]
+    
+    def _build_lazy_section(self, index: int, title: str, build: Callable) -> ft.Control:
+        """Build a section, deferring its content until first expanded."""
+        if self.section_expanded.get(index, False):
+            return build()
+        
+        return Section(
+            title,
+            expanded=False,
+            content_factory=lambda: build().content_control,
+        )
+    
     def _build_data_section(self) -> ft.Control:
         """Build data sources section."""
         new_graph_btn = ft.ElevatedButton(
@@ -149,12 +356,82 @@ class Builder(ft.Container):
         
         return Section("Data Sources", content, expanded=self.section_expanded.get(0, True))
     
+    @contextmanager
+    def _suspend_updates(self):
+        """Defer control updates in the block to one trailing page update.
+        
+        Blocks may nest; only the outermost one sends the update.
+        """
+        self._updates_suspended += 1
+        try:
+            yield
+        finally:
+            self._updates_suspended -= 1
+            if self._updates_suspended:
+                return
+            deferred, self._deferred_updates = self._deferred_updates, []
+            if deferred and self.page is not None:
+                self.page.update()
+    
+    def _update_control(self, control: ft.Control):
+        """Update a control now, or queue it while updates are suspended."""
+        if self._updates_suspended:
+            self._deferred_updates.append(control)
+        else:
+            control.update()
+    
+    def _should_coalesce(self, key) -> bool:
+        """Check whether an edit of key continues a rapid burst of edits to it."""
+        now = time.monotonic()
+        coalesce = key == self._last_snapshot_key and now - self._last_snapshot_time < SNAPSHOT_COALESCE_S
+        self._last_snapshot_key = key
+        self._last_snapshot_time = now
+        return coalesce
+    
+    def _edit(self, path: str, value) -> bool:
+        """Set a state field as an undo event; rapid edits of one field merge."""
+        return self.state.set_field(path, value, merge=self._should_coalesce(path))
+    
+    def _debounce_render(self, key: str):
+        """Re-render the chart once typing in a field pauses."""
+        self._debouncer.run(key, TEXT_DEBOUNCE_MS, self.on_chart_change)
+    
+    def _float_handler(self, commit: Callable, empty: Optional[float] = None) -> Callable:
+        """Build an on_change handler that passes a typed number to commit.
+        
+        Empty text commits empty; partial input that is not a number yet is ignored.
+        """
+        def on_change(e):
+            text = e.control.value
+            if not text:
+                commit(empty)
+                return
+            value = _parse_float(text)
+            if value is not None:
+                commit(value)
+        return on_change
+    
+    def _commit_number(self, path: str, value: Optional[float]):
+        """Commit a numeric config field and re-render once typing pauses."""
+        self._edit(path, value)
+        self._debounce_render(path)
+    
+    def _flush_pending(self, e=None):
+        """Run pending debounced commits now, e.g. when a slider drag ends."""
+        self._debouncer.flush()
+    
+    def _get_df(self) -> Optional[pd.DataFrame]:
+        """Get transformed data, computed at most once per build pass."""
+        if self._cached_df is None:
+            self._cached_df = self.state.get_transformed_data()
+        return self._cached_df
+    
     def _get_data_info(self) -> str:
         """Get data source info text."""
         if self.state.data_source is None:
             return "No data loaded. Load an example or import data."
         
-        df = self.state.get_transformed_data()
+        df = self._get_df()
         if df is None:
             return "No data available."
         
@@ -197,100 +474,97 @@ class Builder(ft.Container):
             ),
         ], spacing=5, wrap=True)
         
-        # Limit display to avoid performance issues
-        max_display_rows = min(10, len(df))
+        # Limit columns to keep rows narrow; rows are built lazily on scroll
         max_display_cols = min(6, len(df.columns))
+        self._editor_df = df
+        self._editor_display_cols = max_display_cols
         
-        # Build editable table
-        table_rows = []
-        
-        # Header row with column names (editable)
+        # Header row with column names (editable) and a delete button per column,
+        # pinned above the scrolling rows
+        cols = df.columns[:max_display_cols].tolist()
         header_cells = [ft.Container(content=ft.Text("Row", size=9, weight=ft.FontWeight.BOLD), width=40, padding=3, bgcolor=ft.colors.SURFACE_VARIANT)]
-        for col_idx, col in enumerate(df.columns[:max_display_cols]):
-            header_cells.append(
-                ft.Container(
-                    content=ft.TextField(
-                        value=str(col),
-                        on_submit=lambda e, idx=col_idx: self._on_column_rename(e, idx),
-                        on_blur=lambda e, idx=col_idx: self._on_column_rename(e, idx),
-                        text_size=9,
-                        height=35,
-                        dense=True,
-                        content_padding=3,
-                        border_color=ft.colors.OUTLINE,
-                    ),
-                    width=100,
-                    padding=2,
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                )
-            )
-        
-        # Add delete column buttons
-        for col_idx in range(max_display_cols):
-            col = df.columns[col_idx]
+        for col_idx, col in enumerate(cols):
             header_cells.append(
                 ft.Container(
-                    content=ft.IconButton(
-                        icon=ft.icons.DELETE_OUTLINE,
-                        icon_size=14,
-                        tooltip=f"Delete column '{col}'",
-                        on_click=lambda _, idx=col_idx: self._on_delete_column(idx),
-                    ),
-                    width=30,
-                    padding=0,
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                )
-            )
-            break  # Only add delete button once in header
-        
-        table_rows.append(ft.Row(header_cells, spacing=1))
-        
-        # Data rows (editable)
-        for row_idx in range(max_display_rows):
-            row_cells = [
-                ft.Container(
-                    content=ft.Text(str(row_idx), size=9, weight=ft.FontWeight.BOLD),
-                    width=40,
-                    padding=3,
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                )
-            ]
-            
-            for col_idx, col in enumerate(df.columns[:max_display_cols]):
-                cell_value = df.iloc[row_idx, col_idx]
-                row_cells.append(
-                    ft.Container(
-                        content=ft.TextField(
-                            value=str(cell_value) if cell_value is not None else "",
-                            on_submit=lambda e, r=row_idx, c=col_idx: self._on_cell_edit(e, r, c),
-                            on_blur=lambda e, r=row_idx, c=col_idx: self._on_cell_edit(e, r, c),
+                    content=ft.Row([
+                        ft.TextField(
+                            value=str(col),
+                            data=col_idx,
+                            on_submit=self._on_column_rename_dispatch,
+                            on_blur=self._on_column_rename_dispatch,
                             text_size=9,
                             height=35,
                             dense=True,
                             content_padding=3,
                             border_color=ft.colors.OUTLINE,
+                            expand=True,
+                        ),
+                        ft.IconButton(
+                            icon=ft.icons.DELETE_OUTLINE,
+                            icon_size=14,
+                            tooltip=f"Delete column '{col}'",
+                            data=col_idx,
+                            on_click=self._on_delete_column_dispatch,
+                            style=ft.ButtonStyle(padding=0),
+                            width=24,
+                            height=24,
                         ),
-                        width=100,
-                        padding=2,
-                        bgcolor=ft.colors.SURFACE if row_idx % 2 == 0 else None,
-                    )
+                    ], spacing=0),
+                    width=100,
+                    padding=2,
+                    bgcolor=ft.colors.SURFACE_VARIANT,
                 )
-            
-            table_rows.append(ft.Row(row_cells, spacing=1, scroll=ft.ScrollMode.AUTO))
+            )
         
-        table_info = ft.Text(
-            f"Showing {max_display_rows} of {len(df)} rows, {max_display_cols} of {len(df.columns)} columns (editable)",
+        # Data rows (editable), virtualized. Once the page is live the first
+        # batch is filled progressively off the UI thread.
+        self._preview_token += 1
+        progressive = self.page is not None
+        initial_rows = [] if progressive else self._build_editor_rows(0, min(EDITOR_ROW_BATCH, len(df)))
+        # Indices of rows that are live widgets rather than placeholders
+        self._editor_live = set(range(len(initial_rows)))
+        self._editor_rows = ft.ListView(
+            controls=initial_rows,
+            item_extent=EDITOR_ROW_EXTENT,
+            spacing=1,
+            expand=True,
+            on_scroll=self._on_editor_scroll,
+            on_scroll_interval=50,
+        )
+        self._editor_spinner = ft.ProgressRing(width=12, height=12, stroke_width=2, visible=progressive)
+        
+        self._editor_info = ft.Text(
+            self._editor_summary(),
             size=9,
             italic=True,
             color=ft.colors.ON_SURFACE_VARIANT,
         )
+        table_info = ft.Row([
+            self._editor_info,
+            self._editor_spinner,
+        ], spacing=5)
+        
+        if progressive:
+            self.page.run_thread(self._populate_editor_rows, self._preview_token)
+        else:
+            self._preview_done_token = self._preview_token
         
         content = ft.Column([
             controls_row,
             ft.Divider(height=1),
             table_info,
             ft.Container(
-                content=ft.Column(table_rows, spacing=1, scroll=ft.ScrollMode.AUTO),
+                # Single horizontal scroll region for the whole table; the
+                # vertical ListView inside needs a bounded width
+                content=ft.Row([
+                    ft.Container(
+                        content=ft.Column([
+                            ft.Row(header_cells, spacing=1),
+                            self._editor_rows,
+                        ], spacing=1),
+                        width=sum(cell.width for cell in header_cells) + len(header_cells),
+                    ),
+                ], scroll=ft.ScrollMode.AUTO),
                 border=ft.border.all(1, ft.colors.OUTLINE),
                 border_radius=4,
                 height=400,  # Fixed height with scrolling
@@ -299,30 +573,146 @@ class Builder(ft.Container):
         
         return Section("Data Editor", content, expanded=self.section_expanded.get(1, False))
     
+    def _editor_summary(self) -> str:
+        """Describe the size of the frame shown in the data editor."""
+        df = self._editor_df
+        return f"{len(df)} rows, showing {self._editor_display_cols} of {len(df.columns)} columns (editable)"
+    
+    def _sync_editor_rows(self) -> bool:
+        """Match the built editor rows to a df that gained or lost trailing rows.
+        
+        Only the rows at the end are built or dropped. Returns False when the
+        editor has to be rebuilt instead.
+        """
+        df = self.state.data_source.df
+        if self._preview_done_token != self._preview_token or len(df) == 0:
+            return False  # Still filling, or the table gives way to a placeholder
+        
+        rows = self._editor_rows.controls
+        built = len(rows)
+        self._editor_df = df
+        if built > len(df):
+            del rows[len(df):]
+            self._editor_live.discard(len(df))
+        elif built == len(df) - 1:
+            # Every row was built, so show the new one too
+            rows.extend(self._build_editor_rows(built, len(df)))
+            self._editor_live.add(built)
+        
+        self._editor_info.value = self._editor_summary()
+        with self._suspend_updates():
+            self._update_control(self._editor_rows)
+            self._update_control(self._editor_info)
+        return True
+    
+    def _build_editor_rows(self, start: int, end: int) -> list:
+        """Build editable data rows start..end-1 from one ndarray slice."""
+        sub = self._editor_df.iloc[start:end, :self._editor_display_cols]
+        # One vectorized conversion per batch; missing values (None/NaN/NA) show as empty
+        values = sub.astype(str).where(sub.notna(), "").to_numpy()
+        return [
+            self._build_editor_row(row_idx, row_values)
+            for row_idx, row_values in zip(range(start, end), values)
+        ]
+    
+    def _build_editor_row(self, row_idx: int, row_values) -> ft.Control:
+        """Build one editable data row from its display strings."""
+        row_cells = [
+            ft.Container(
+                content=ft.Text(str(row_idx), size=9, weight=ft.FontWeight.BOLD),
+                width=40,
+                padding=3,
+                bgcolor=ft.colors.SURFACE_VARIANT,
+            )
+        ]
+        
+        for col_idx, cell_value in enumerate(row_values):
+            row_cells.append(
+                ft.Container(
+                    content=ft.TextField(
+                        value=cell_value,
+                        data=(row_idx, col_idx),
+                        on_submit=self._on_cell_edit_dispatch,
+                        on_blur=self._on_cell_edit_dispatch,
+                        text_size=9,
+                        height=35,
+                        dense=True,
+                        content_padding=3,
+                        border_color=ft.colors.OUTLINE,
+                    ),
+                    width=100,
+                    padding=2,
+                    bgcolor=ft.colors.SURFACE if row_idx % 2 == 0 else None,
+                )
+            )
+        
+        return ft.Row(row_cells, spacing=1)
+    
+    def _populate_editor_rows(self, token: int):
+        """Fill the first batch of editor rows a chunk at a time."""
+        rows = self._editor_rows
+        end = min(EDITOR_ROW_BATCH, len(self._editor_df))
+        for start in range(0, end, EDITOR_ROW_CHUNK):
+            chunk = self._build_editor_rows(start, min(start + EDITOR_ROW_CHUNK, end))
+            if token != self._preview_token:
+                return  # A newer build replaced this table
+            rows.controls.extend(chunk)
+            self._editor_live.update(range(start, start + len(chunk)))
+            self.page.update()
+        
+        self._preview_done_token = token
+        self._editor_spinner.visible = False
+        self.page.update()
+    
+    def _on_editor_scroll(self, e: ft.OnScrollEvent):
+        """Build the next batch of editor rows near the end and window the live rows."""
+        if self._preview_done_token != self._preview_token:
+            return  # First batch still being filled
+        
+        rows = self._editor_rows.controls
+        built = len(rows)
+        changed = False
+        if built < len(self._editor_df) and e.pixels >= e.max_scroll_extent - EDITOR_ROW_EXTENT * 5:
+            end = min(built + EDITOR_ROW_BATCH, len(self._editor_df))
+            rows.extend(self._build_editor_rows(built, end))
+            self._editor_live.update(range(built, end))
+            changed = True
+        
+        if self._window_editor_rows(int(e.pixels // EDITOR_ROW_EXTENT)) or changed:
+            self._editor_rows.update()
+    
+    def _window_editor_rows(self, first_visible: int) -> bool:
+        """Keep live widgets only for rows near the viewport. Returns True if any row changed."""
+        rows = self._editor_rows.controls
+        lo = max(0, first_visible - EDITOR_ROW_WINDOW // 2)
+        wanted = set(range(lo, min(len(rows), first_visible + EDITOR_ROW_WINDOW)))
+        stale = self._editor_live - wanted
+        missing = sorted(wanted - self._editor_live)
+        
+        # The fixed item extent keeps the scroll geometry of placeholder rows
+        for i in stale:
+            rows[i] = ft.Container()
+        
+        # Rebuild rows scrolled back into the window, one slice per contiguous run
+        run_start = 0
+        for k in range(1, len(missing) + 1):
+            if k == len(missing) or missing[k] != missing[k - 1] + 1:
+                start, end = missing[run_start], missing[k - 1] + 1
+                rows[start:end] = self._build_editor_rows(start, end)
+                run_start = k
+        
+        self._editor_live = wanted
+        return bool(stale or missing)
+    
     def _build_chart_type_section(self) -> ft.Control:
         """Build chart type selection."""
         chart_type = ft.Dropdown(
-            options=[
-                ft.dropdown.Option("line", "Line"),
-                ft.dropdown.Option("area", "Area"),
-                ft.dropdown.Option("bar", "Bar"),
-                ft.dropdown.Option("stacked_bar", "Stacked Bar"),
-                ft.dropdown.Option("bar_100", "100% Bar"),
-                ft.dropdown.Option("scatter", "Scatter"),
-                ft.dropdown.Option("step", "Step"),
-                ft.dropdown.Option("histogram", "Histogram"),
-                ft.dropdown.Option("kde", "KDE"),
-                ft.dropdown.Option("box", "Box Plot"),
-                ft.dropdown.Option("violin", "Violin Plot"),
-            ],
+            options=_dropdown_options(CHART_TYPE_CHOICES),
             value=self.state.chart_config.chart_type,
             on_change=self._on_chart_type_change,
             height=60,
             text_size=13,
-            content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-            bgcolor=ft.colors.SURFACE_VARIANT,
-            color=ft.colors.ON_SURFACE,
-            border_color=ft.colors.OUTLINE,
+            **_FIELD_STYLE,
         )
         
         content = ft.Column([
@@ -333,36 +723,37 @@ class Builder(ft.Container):
     
     def _on_chart_type_change(self, e):
         """Handle chart type change."""
-        self.state.chart_config.chart_type = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        with self._suspend_updates():
+            self._edit("chart_config.chart_type", e.control.value)
+            self.on_chart_change()
     
     def _build_series_section(self) -> ft.Control:
         """Build series configuration."""
         if self.state.data_source is None:
             return Section("Series", ft.Text("No data loaded", size=11))
         
-        df = self.state.get_transformed_data()
+        df = self._get_df()
         if df is None:
             return Section("Series", ft.Text("No data available", size=11))
         
+        # Column choices shared by every column dropdown in this build pass.
+        # Flet controls can only have one parent, so each dropdown still gets
+        # its own Option instances built from these tuples.
+        self._column_choices = [(col, col) for col in df.columns]
+        
         # X column selector
         x_column = ft.Dropdown(
-            options=[ft.dropdown.Option(col, col) for col in df.columns],
+            options=self._column_options(),
             value=self.state.chart_config.x_column,
             on_change=self._on_x_column_change,
             label="X Column",
             height=60,
             text_size=13,
-            content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-            bgcolor=ft.colors.SURFACE_VARIANT,
-            color=ft.colors.ON_SURFACE,
-            border_color=ft.colors.OUTLINE,
+            **_FIELD_STYLE,
         )
         
         # Auto-create series styles if needed (but not for blank data)
-        if not self.state.chart_config.series_styles and self.state.data_source.name != "Blank":
-            self._auto_create_series()
+        self._auto_create_series()
         
         # Add series button
         add_series_btn = ft.ElevatedButton(
@@ -373,59 +764,106 @@ class Builder(ft.Container):
         )
         
         # Series list
-        series_controls = []
-        for i, series in enumerate(self.state.chart_config.series_styles):
-            series_controls.append(
+        self._series_swatches = {}
+        self._series_list = ft.Column(
+            [
                 self._build_series_control(series, i)
-            )
+                for i, series in enumerate(self.state.chart_config.series_styles)
+            ],
+            spacing=10,
+        )
         
         content = ft.Column([
             x_column,
             add_series_btn,
             ft.Divider(),
-            *series_controls,
+            self._series_list,
         ], spacing=10)
         
         return Section("Series", content, expanded=self.section_expanded.get(3, True))
     
     def _auto_create_series(self):
-        """Auto-create series styles for numeric columns."""
-        df = self.state.get_transformed_data()
+        """Auto-create series styles for numeric columns, once per data source."""
+        source = self.state.data_source
+        if (self._auto_series_source is source
+                or self.state.chart_config.series_styles
+                or source.name == "Blank"):
+            return
+        
+        df = self._get_df()
         if df is None:
             return
+        self._auto_series_source = source
         
-        # Get numeric columns (excluding X column)
+        # Create series styles for numeric columns (excluding X column)
         x_col = self.state.chart_config.x_column
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        
-        if x_col in numeric_cols:
-            numeric_cols.remove(x_col)
-        
-        # Create series styles
-        for col in numeric_cols[:10]:  # Limit to 10 series
-            self.state.chart_config.series_styles.append(
-                SeriesStyle(column=col, visible=True)
-            )
+        numeric_cols = [c for c in self._numeric_columns(df) if c != x_col]
+        self.state.chart_config.series_styles.extend(
+            SeriesStyle(column=col, visible=True) for col in numeric_cols[:10]  # Limit to 10 series
+        )
+    
+    def _begin_df_edit(self):
+        """Prepare for an in-place change of the live df, dropping caches keyed on it."""
+        self.state.begin_df_edit()
+        self._numeric_cols_cache = None
+    
+    def _numeric_columns(self, df: pd.DataFrame) -> list:
+        """Get numeric column names, cached for the same DataFrame object."""
+        cache = self._numeric_cols_cache
+        if cache is None or cache[0] is not df:
+            # Same selection as select_dtypes(include=['number']), which skips bools
+            cols = [
+                c for c, dt in zip(df.columns, df.dtypes)
+                if pd.api.types.is_numeric_dtype(dt) and not pd.api.types.is_bool_dtype(dt)
+            ]
+            cache = self._numeric_cols_cache = (df, cols)
+        return cache[1]
+    
+    def _column_options(self) -> list:
+        """Build dropdown options from the cached column choices."""
+        return _dropdown_options(self._column_choices)
     
     def _build_series_control(self, series: SeriesStyle, index: int) -> ft.Control:
         """Build control for single series."""
-        # Get available columns for dropdown
-        df = self.state.get_transformed_data()
-        available_columns = list(df.columns) if df is not None else [series.column]
+        # Resolve the displayed color once: explicit color or palette fallback
+        palette = self.state.theme.color_palette
+        effective_color = series.color or palette[index % len(palette)]
+        
+        # Color swatch and field are kept so color edits can update them in place
+        swatch = ft.Container(
+            width=30,
+            height=30,
+            bgcolor=effective_color,
+            border_radius=4,
+            border=ft.border.all(1, ft.colors.OUTLINE),
+        )
+        color_field = ft.TextField(
+            value=effective_color,
+            data=("color", series),
+            on_change=self._on_series_field_change,
+            hint_text="#RRGGBB",
+            height=50,
+            text_size=12,
+            expand=True,
+            **_FIELD_STYLE,
+        )
+        self._series_swatches[id(series)] = (swatch, color_field)
         
         return ft.Container(
             content=ft.Column([
                 ft.Row([
                     ft.Checkbox(
                         value=series.visible,
-                        on_change=lambda e, idx=index: self._on_series_visible_change(e, idx),
+                        data=("visible", series),
+                        on_change=self._on_series_field_change,
                     ),
                     ft.Text(series.label if series.label else series.column, size=12, weight=ft.FontWeight.W_500, expand=True),
                     ft.IconButton(
                         icon=ft.icons.DELETE,
                         icon_size=18,
                         tooltip="Remove series",
-                        on_click=lambda _, idx=index: self._on_delete_series(idx),
+                        data=series,
+                        on_click=self._on_delete_series_dispatch,
                     ),
                 ], alignment=ft.MainAxisAlignment.START),
                 ft.Container(
@@ -433,53 +871,29 @@ class Builder(ft.Container):
                         LabeledControl(
                             "Data Column",
                             ft.Dropdown(
-                                options=[ft.dropdown.Option(col, col) for col in available_columns],
+                                options=self._column_options(),
                                 value=series.column,
-                                on_change=lambda e, idx=index: self._on_series_column_change(e, idx),
+                                data=("column", series),
+                                on_change=self._on_series_field_change,
                                 height=55,
                                 text_size=12,
-                                content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                                bgcolor=ft.colors.SURFACE_VARIANT,
-                                color=ft.colors.ON_SURFACE,
-                                border_color=ft.colors.OUTLINE,
+                                **_DROPDOWN_STYLE,
                             ),
                         ),
                         LabeledControl(
                             "Label",
                             ft.TextField(
                                 value=series.label if series.label else series.column,
-                                on_change=lambda e, idx=index: self._on_series_label_change(e, idx),
+                                data=("label", series),
+                                on_change=self._on_series_field_change,
                                 height=50,
                                 text_size=13,
-                                content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                                bgcolor=ft.colors.SURFACE_VARIANT,
-                                color=ft.colors.ON_SURFACE,
-                                border_color=ft.colors.OUTLINE,
+                                **_FIELD_STYLE,
                             ),
                         ),
                         ft.Column([
                             ft.Text("Color", size=12, weight=ft.FontWeight.W_500),
-                            ft.Row([
-                                ft.Container(
-                                    width=30,
-                                    height=30,
-                                    bgcolor=series.color if series.color else self.state.theme.color_palette[index % len(self.state.theme.color_palette)],
-                                    border_radius=4,
-                                    border=ft.border.all(1, ft.colors.OUTLINE),
-                                ),
-                                ft.TextField(
-                                    value=series.color if series.color else self.state.theme.color_palette[index % len(self.state.theme.color_palette)],
-                                    on_change=lambda e, idx=index: self._on_series_color_change(e, idx),
-                                    hint_text="#RRGGBB",
-                                    height=50,
-                                    text_size=12,
-                                    expand=True,
-                                    content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                                    bgcolor=ft.colors.SURFACE_VARIANT,
-                                    color=ft.colors.ON_SURFACE,
-                                    border_color=ft.colors.OUTLINE,
-                                ),
-                            ], spacing=5),
+                            ft.Row([swatch, color_field], spacing=5),
                         ], spacing=5),
                         LabeledControl(
                             "Line Width",
@@ -487,50 +901,33 @@ class Builder(ft.Container):
                                 min=0.5,
                                 max=5,
                                 value=series.line_width,
-                                on_change=lambda e, idx=index: self._on_series_width_change(e, idx),
+                                data=("line_width", series),
+                                on_change=self._on_series_field_change,
+                                on_change_end=self._flush_pending,
                             ),
                         ),
                         LabeledControl(
                             "Line Style",
                             ft.Dropdown(
-                                options=[
-                                    ft.dropdown.Option("solid", "Solid"),
-                                    ft.dropdown.Option("dashed", "Dashed"),
-                                    ft.dropdown.Option("dotted", "Dotted"),
-                                    ft.dropdown.Option("dashdot", "Dash-Dot"),
-                                ],
+                                options=_dropdown_options(LINE_STYLE_CHOICES),
                                 value=series.line_style,
-                                on_change=lambda e, idx=index: self._on_series_style_change(e, idx),
+                                data=("line_style", series),
+                                on_change=self._on_series_field_change,
                                 height=55,
                                 text_size=12,
-                                content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                                bgcolor=ft.colors.SURFACE_VARIANT,
-                                color=ft.colors.ON_SURFACE,
-                                border_color=ft.colors.OUTLINE,
+                                **_DROPDOWN_STYLE,
                             ),
                         ),
                         LabeledControl(
                             "Marker",
                             ft.Dropdown(
-                                options=[
-                                    ft.dropdown.Option("", "None"),
-                                    ft.dropdown.Option("o", "Circle"),
-                                    ft.dropdown.Option("s", "Square"),
-                                    ft.dropdown.Option("^", "Triangle Up"),
-                                    ft.dropdown.Option("v", "Triangle Down"),
-                                    ft.dropdown.Option("D", "Diamond"),
-                                    ft.dropdown.Option("*", "Star"),
-                                    ft.dropdown.Option("+", "Plus"),
-                                    ft.dropdown.Option("x", "X"),
-                                ],
+                                options=_dropdown_options(MARKER_CHOICES),
                                 value=series.marker,
-                                on_change=lambda e, idx=index: self._on_series_marker_change(e, idx),
+                                data=("marker", series),
+                                on_change=self._on_series_field_change,
                                 height=55,
                                 text_size=12,
-                                content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                                bgcolor=ft.colors.SURFACE_VARIANT,
-                                color=ft.colors.ON_SURFACE,
-                                border_color=ft.colors.OUTLINE,
+                                **_DROPDOWN_STYLE,
                             ),
                         ),
                         LabeledControl(
@@ -539,7 +936,9 @@ class Builder(ft.Container):
                                 min=2,
                                 max=15,
                                 value=series.marker_size,
-                                on_change=lambda e, idx=index: self._on_series_marker_size_change(e, idx),
+                                data=("marker_size", series),
+                                on_change=self._on_series_field_change,
+                                on_change_end=self._flush_pending,
                             ),
                         ),
                         LabeledControl(
@@ -548,25 +947,22 @@ class Builder(ft.Container):
                                 min=0.1,
                                 max=1.0,
                                 value=series.alpha,
-                                on_change=lambda e, idx=index: self._on_series_alpha_change(e, idx),
+                                data=("alpha", series),
+                                on_change=self._on_series_field_change,
+                                on_change_end=self._flush_pending,
                                 divisions=9,
                             ),
                         ),
                         LabeledControl(
                             "Y Axis",
                             ft.Dropdown(
-                                options=[
-                                    ft.dropdown.Option("primary", "Primary"),
-                                    ft.dropdown.Option("secondary", "Secondary"),
-                                ],
+                                options=_dropdown_options(Y_AXIS_CHOICES),
                                 value=series.y_axis,
-                                on_change=lambda e, idx=index: self._on_series_axis_change(e, idx),
+                                data=("y_axis", series),
+                                on_change=self._on_series_field_change,
                                 height=55,
                                 text_size=12,
-                                content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                                bgcolor=ft.colors.SURFACE_VARIANT,
-                                color=ft.colors.ON_SURFACE,
-                                border_color=ft.colors.OUTLINE,
+                                **_DROPDOWN_STYLE,
                             ),
                         ),
                     ], spacing=5),
@@ -579,78 +975,115 @@ class Builder(ft.Container):
             padding=10,
         )
     
+    def _on_series_field_change(self, e):
+        """Dispatch a series control change to its field handler."""
+        field, series = e.control.data
+        index = self._series_index(series)
+        if index is None:
+            return
+        
+        # Flet also fires on_change for focus and programmatic sets; skip no-ops
+        value = e.control.value
+        if field == "color":
+            value = value if value else None
+        if getattr(series, field) == value:
+            return
+        
+        getattr(self, self.SERIES_FIELD_HANDLERS[field])(e, index)
+    
+    def _on_delete_series_dispatch(self, e):
+        """Dispatch a series delete click."""
+        index = self._series_index(e.control.data)
+        if index is not None:
+            self._on_delete_series(index)
+    
+    def _series_index(self, series: SeriesStyle) -> Optional[int]:
+        """Find the current position of a series in the chart config."""
+        for i, s in enumerate(self.state.chart_config.series_styles):
+            if s is series:
+                return i
+        return None
+    
     def _on_x_column_change(self, e):
         """Handle X column change."""
-        self.state.chart_config.x_column = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("chart_config.x_column", e.control.value)
+        self.on_chart_change()
     
     def _on_series_visible_change(self, e, index: int):
         """Handle series visibility change."""
-        self.state.chart_config.series_styles[index].visible = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        had_secondary = self.state.chart_config.has_secondary_axis
+        self._edit(f"chart_config.series_styles.{index}.visible", e.control.value)
+        with self._suspend_updates():
+            self._sync_secondary_axis(had_secondary)
+            self.on_chart_change()
     
     def _on_series_width_change(self, e, index: int):
         """Handle series line width change."""
-        self.state.chart_config.series_styles[index].line_width = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit(f"chart_config.series_styles.{index}.line_width", e.control.value)
+        # Coalesce drag ticks into one re-render
+        self._debouncer.run(f"width_{index}", SLIDER_DEBOUNCE_MS, self.on_chart_change)
     
     def _on_series_style_change(self, e, index: int):
         """Handle series line style change."""
-        self.state.chart_config.series_styles[index].line_style = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit(f"chart_config.series_styles.{index}.line_style", e.control.value)
+        self.on_chart_change()
     
     def _on_series_axis_change(self, e, index: int):
         """Handle series axis change."""
-        self.state.chart_config.series_styles[index].y_axis = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        had_secondary = self.state.chart_config.has_secondary_axis
+        self._edit(f"chart_config.series_styles.{index}.y_axis", e.control.value)
+        with self._suspend_updates():
+            self._sync_secondary_axis(had_secondary)
+            self.on_chart_change()
+    
+    def _sync_secondary_axis(self, had_secondary: bool):
+        """Show or hide the secondary Y axis controls when a series edit toggles its use."""
+        if self.state.chart_config.has_secondary_axis != had_secondary:
+            self._rebuild_section(4)
     
     def _on_series_column_change(self, e, index: int):
         """Handle series data column change."""
-        self.state.chart_config.series_styles[index].column = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit(f"chart_config.series_styles.{index}.column", e.control.value)
+        self.on_chart_change()
     
     def _on_series_label_change(self, e, index: int):
         """Handle series label change."""
-        self.state.chart_config.series_styles[index].label = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit(f"chart_config.series_styles.{index}.label", e.control.value)
+        self._debounce_render(f"label_{index}")
     
     def _on_series_color_change(self, e, index: int):
         """Handle series color change."""
-        color_value = e.control.value if e.control.value else None
-        self.state.chart_config.series_styles[index].color = color_value
-        self.state.save_snapshot()
-        # Rebuild series section to update color preview
-        self._rebuild_section(3)
-        self.on_change()
+        with self._suspend_updates():
+            color_value = e.control.value if e.control.value else None
+            self._edit(f"chart_config.series_styles.{index}.color", color_value)
+            # Update only the color preview swatch
+            swatch, _ = self._series_swatches.get(id(self.state.chart_config.series_styles[index]), (None, None))
+            if swatch is not None:
+                palette = self.state.theme.color_palette
+                swatch.bgcolor = color_value or palette[index % len(palette)]
+                self._update_control(swatch)
+            self._debounce_render(f"color_{index}")
     
     def _on_series_marker_change(self, e, index: int):
         """Handle series marker change."""
-        self.state.chart_config.series_styles[index].marker = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit(f"chart_config.series_styles.{index}.marker", e.control.value)
+        self.on_chart_change()
     
     def _on_series_marker_size_change(self, e, index: int):
         """Handle series marker size change."""
-        self.state.chart_config.series_styles[index].marker_size = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit(f"chart_config.series_styles.{index}.marker_size", e.control.value)
+        # Coalesce drag ticks into one re-render
+        self._debouncer.run(f"marker_size_{index}", SLIDER_DEBOUNCE_MS, self.on_chart_change)
     
     def _on_series_alpha_change(self, e, index: int):
         """Handle series transparency change."""
-        self.state.chart_config.series_styles[index].alpha = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit(f"chart_config.series_styles.{index}.alpha", e.control.value)
+        # Coalesce drag ticks into one re-render
+        self._debouncer.run(f"alpha_{index}", SLIDER_DEBOUNCE_MS, self.on_chart_change)
     
     def _on_add_series(self, e):
         """Add a new series."""
-        df = self.state.get_transformed_data()
+        df = self._get_df()
         if df is None:
             return
         
@@ -660,86 +1093,91 @@ class Builder(ft.Container):
         available_cols = [col for col in df.columns if col not in existing_columns and col != x_col]
         
         if available_cols:
-            # Add the first available column
-            self.state.chart_config.series_styles.append(
-                SeriesStyle(column=available_cols[0], visible=True)
-            )
-            self.state.save_snapshot()
-            # Rebuild the series section only
-            self._rebuild_section(2)  # Series section is at index 2
-            self.on_change()
+            with self._suspend_updates():
+                # Add the first available column
+                series = SeriesStyle(column=available_cols[0], visible=True)
+                self.state.chart_config.series_styles.append(series)
+                self.state.save_snapshot()
+                # Append just the new row; the others are left as built
+                self._series_list.controls.append(
+                    self._build_series_control(series, len(self.state.chart_config.series_styles) - 1)
+                )
+                self._update_control(self._series_list)
+                self.on_change()
     
     def _on_delete_series(self, index: int):
         """Delete a series."""
         if len(self.state.chart_config.series_styles) > 0:
-            self.state.chart_config.series_styles.pop(index)
-            self.state.save_snapshot()
-            # Rebuild the series section only
-            self._rebuild_section(3)  # Series section is at index 3
-            self.on_change()
+            with self._suspend_updates():
+                removed = self.state.chart_config.series_styles.pop(index)
+                self.state.save_snapshot()
+                # Drop just this row; the others find their series by identity
+                self._series_swatches.pop(id(removed), None)
+                self._series_list.controls.pop(index)
+                self._update_control(self._series_list)
+                self._sync_palette_colors(index)
+                self.on_change()
+    
+    def _sync_palette_colors(self, start: int):
+        """Refresh palette-fallback colors of series rows shifted up from start."""
+        palette = self.state.theme.color_palette
+        for i, series in enumerate(self.state.chart_config.series_styles[start:], start):
+            if series.color:
+                continue
+            swatch, color_field = self._series_swatches[id(series)]
+            swatch.bgcolor = color_field.value = palette[i % len(palette)]
+            self._update_control(swatch)
+            self._update_control(color_field)
     
     def _build_axes_section(self) -> ft.Control:
         """Build axes configuration."""
+        x = self.state.chart_config.x_axis
+        y = self.state.chart_config.y_axis_primary
         content = ft.Column([
             ft.Text("X Axis", size=12, weight=ft.FontWeight.BOLD),
             LabeledControl(
                 "Label",
                 ft.TextField(
-                    value=self.state.chart_config.x_axis.label,
+                    value=x.label,
                     on_change=self._on_x_label_change,
                     height=50,
                     text_size=13,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_FIELD_STYLE,
                 ),
             ),
             LabeledControl(
                 "Scale",
                 ft.Dropdown(
-                    options=[
-                        ft.dropdown.Option("linear", "Linear"),
-                        ft.dropdown.Option("log", "Logarithmic"),
-                    ],
-                    value=self.state.chart_config.x_axis.scale,
+                    options=_dropdown_options(SCALE_CHOICES),
+                    value=x.scale,
                     on_change=self._on_x_scale_change,
                     height=55,
                     text_size=12,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_DROPDOWN_STYLE,
                 ),
             ),
             ft.Column([
                 ft.Text("Range", size=11, weight=ft.FontWeight.W_500),
                 ft.Row([
                     ft.TextField(
-                        value=str(self.state.chart_config.x_axis.min_value) if self.state.chart_config.x_axis.min_value is not None else "",
-                        on_change=self._on_x_min_change,
+                        value=_fmt_optional(x.min_value),
+                        on_change=self._float_handler(partial(self._commit_number, "chart_config.x_axis.min_value")),
                         hint_text="Min",
                         label="Min",
                         height=50,
                         text_size=12,
                         expand=True,
-                        content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                        bgcolor=ft.colors.SURFACE_VARIANT,
-                        color=ft.colors.ON_SURFACE,
-                        border_color=ft.colors.OUTLINE,
+                        **_FIELD_STYLE,
                     ),
                     ft.TextField(
-                        value=str(self.state.chart_config.x_axis.max_value) if self.state.chart_config.x_axis.max_value is not None else "",
-                        on_change=self._on_x_max_change,
+                        value=_fmt_optional(x.max_value),
+                        on_change=self._float_handler(partial(self._commit_number, "chart_config.x_axis.max_value")),
                         hint_text="Max",
                         label="Max",
                         height=50,
                         text_size=12,
                         expand=True,
-                        content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                        bgcolor=ft.colors.SURFACE_VARIANT,
-                        color=ft.colors.ON_SURFACE,
-                        border_color=ft.colors.OUTLINE,
+                        **_FIELD_STYLE,
                     ),
                 ], spacing=5),
             ], spacing=5),
@@ -748,37 +1186,28 @@ class Builder(ft.Container):
             LabeledControl(
                 "Label",
                 ft.TextField(
-                    value=self.state.chart_config.y_axis_primary.label,
+                    value=y.label,
                     on_change=self._on_y_label_change,
                     height=50,
                     text_size=13,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_FIELD_STYLE,
                 ),
             ),
             LabeledControl(
                 "Scale",
                 ft.Dropdown(
-                    options=[
-                        ft.dropdown.Option("linear", "Linear"),
-                        ft.dropdown.Option("log", "Logarithmic"),
-                    ],
-                    value=self.state.chart_config.y_axis_primary.scale,
+                    options=_dropdown_options(SCALE_CHOICES),
+                    value=y.scale,
                     on_change=self._on_y_scale_change,
                     height=55,
                     text_size=12,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_DROPDOWN_STYLE,
                 ),
             ),
             LabeledControl(
                 "Grid",
                 ft.Switch(
-                    value=self.state.chart_config.y_axis_primary.show_grid,
+                    value=y.show_grid,
                     on_change=self._on_grid_change,
                 ),
             ),
@@ -786,42 +1215,31 @@ class Builder(ft.Container):
                 ft.Text("Range", size=11, weight=ft.FontWeight.W_500),
                 ft.Row([
                     ft.TextField(
-                        value=str(self.state.chart_config.y_axis_primary.min_value) if self.state.chart_config.y_axis_primary.min_value is not None else "",
-                        on_change=self._on_y_min_change,
+                        value=_fmt_optional(y.min_value),
+                        on_change=self._float_handler(partial(self._commit_number, "chart_config.y_axis_primary.min_value")),
                         hint_text="Min",
                         label="Min",
                         height=50,
                         text_size=12,
                         expand=True,
-                        content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                        bgcolor=ft.colors.SURFACE_VARIANT,
-                        color=ft.colors.ON_SURFACE,
-                        border_color=ft.colors.OUTLINE,
+                        **_FIELD_STYLE,
                     ),
                     ft.TextField(
-                        value=str(self.state.chart_config.y_axis_primary.max_value) if self.state.chart_config.y_axis_primary.max_value is not None else "",
-                        on_change=self._on_y_max_change,
+                        value=_fmt_optional(y.max_value),
+                        on_change=self._float_handler(partial(self._commit_number, "chart_config.y_axis_primary.max_value")),
                         hint_text="Max",
                         label="Max",
                         height=50,
                         text_size=12,
                         expand=True,
-                        content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                        bgcolor=ft.colors.SURFACE_VARIANT,
-                        color=ft.colors.ON_SURFACE,
-                        border_color=ft.colors.OUTLINE,
+                        **_FIELD_STYLE,
                     ),
                 ], spacing=5),
             ], spacing=5),
         ], spacing=10)
         
         # Add secondary Y axis if any series uses it
-        has_secondary = any(
-            s.y_axis == "secondary" and s.visible 
-            for s in self.state.chart_config.series_styles
-        )
-        
-        if has_secondary:
+        if self.state.chart_config.has_secondary_axis:
             # Ensure secondary axis config exists
             if self.state.chart_config.y_axis_secondary is None:
                 from ..models.data_models import AxisConfig
@@ -837,27 +1255,18 @@ class Builder(ft.Container):
                         on_change=self._on_y2_label_change,
                         height=50,
                         text_size=13,
-                        content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                        bgcolor=ft.colors.SURFACE_VARIANT,
-                        color=ft.colors.ON_SURFACE,
-                        border_color=ft.colors.OUTLINE,
+                        **_FIELD_STYLE,
                     ),
                 ),
                 LabeledControl(
                     "Scale",
                     ft.Dropdown(
-                        options=[
-                            ft.dropdown.Option("linear", "Linear"),
-                            ft.dropdown.Option("log", "Logarithmic"),
-                        ],
+                        options=_dropdown_options(SCALE_CHOICES),
                         value=self.state.chart_config.y_axis_secondary.scale,
                         on_change=self._on_y2_scale_change,
                         height=55,
                         text_size=12,
-                        content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                        bgcolor=ft.colors.SURFACE_VARIANT,
-                        color=ft.colors.ON_SURFACE,
-                        border_color=ft.colors.OUTLINE,
+                        **_DROPDOWN_STYLE,
                     ),
                 ),
             ])
@@ -866,87 +1275,40 @@ class Builder(ft.Container):
     
     def _on_x_label_change(self, e):
         """Handle X label change."""
-        self.state.chart_config.x_axis.label = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("chart_config.x_axis.label", e.control.value)
+        self._debounce_render("x_label")
     
     def _on_x_scale_change(self, e):
         """Handle X scale change."""
-        self.state.chart_config.x_axis.scale = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
-    
-    def _on_x_min_change(self, e):
-        """Handle X min change."""
-        try:
-            val = float(e.control.value) if e.control.value else None
-            self.state.chart_config.x_axis.min_value = val
-            self.state.save_snapshot()
-            self.on_change()
-        except ValueError:
-            pass
-    
-    def _on_x_max_change(self, e):
-        """Handle X max change."""
-        try:
-            val = float(e.control.value) if e.control.value else None
-            self.state.chart_config.x_axis.max_value = val
-            self.state.save_snapshot()
-            self.on_change()
-        except ValueError:
-            pass
+        self._edit("chart_config.x_axis.scale", e.control.value)
+        self.on_chart_change()
     
     def _on_y_label_change(self, e):
         """Handle Y label change."""
-        self.state.chart_config.y_axis_primary.label = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("chart_config.y_axis_primary.label", e.control.value)
+        self._debounce_render("y_label")
     
     def _on_y_scale_change(self, e):
         """Handle Y scale change."""
-        self.state.chart_config.y_axis_primary.scale = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("chart_config.y_axis_primary.scale", e.control.value)
+        self.on_chart_change()
     
     def _on_grid_change(self, e):
         """Handle grid toggle."""
-        self.state.chart_config.y_axis_primary.show_grid = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
-    
-    def _on_y_min_change(self, e):
-        """Handle Y min change."""
-        try:
-            val = float(e.control.value) if e.control.value else None
-            self.state.chart_config.y_axis_primary.min_value = val
-            self.state.save_snapshot()
-            self.on_change()
-        except ValueError:
-            pass
-    
-    def _on_y_max_change(self, e):
-        """Handle Y max change."""
-        try:
-            val = float(e.control.value) if e.control.value else None
-            self.state.chart_config.y_axis_primary.max_value = val
-            self.state.save_snapshot()
-            self.on_change()
-        except ValueError:
-            pass
+        self._edit("chart_config.y_axis_primary.show_grid", e.control.value)
+        self.on_chart_change()
     
     def _on_y2_label_change(self, e):
         """Handle secondary Y label change."""
         if self.state.chart_config.y_axis_secondary:
-            self.state.chart_config.y_axis_secondary.label = e.control.value
-            self.state.save_snapshot()
-            self.on_change()
+            self._edit("chart_config.y_axis_secondary.label", e.control.value)
+            self._debounce_render("y2_label")
     
     def _on_y2_scale_change(self, e):
         """Handle secondary Y scale change."""
         if self.state.chart_config.y_axis_secondary:
-            self.state.chart_config.y_axis_secondary.scale = e.control.value
-            self.state.save_snapshot()
-            self.on_change()
+            self._edit("chart_config.y_axis_secondary.scale", e.control.value)
+            self.on_chart_change()
     
     def _build_layout_section(self) -> ft.Control:
         """Build layout configuration."""
@@ -958,10 +1320,7 @@ class Builder(ft.Container):
                     on_change=self._on_title_change,
                     height=50,
                     text_size=13,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_FIELD_STYLE,
                 ),
             ),
             LabeledControl(
@@ -971,31 +1330,18 @@ class Builder(ft.Container):
                     on_change=self._on_subtitle_change,
                     height=50,
                     text_size=13,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=10),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_FIELD_STYLE,
                 ),
             ),
             LabeledControl(
                 "Legend",
                 ft.Dropdown(
-                    options=[
-                        ft.dropdown.Option("best", "Best"),
-                        ft.dropdown.Option("upper right", "Upper Right"),
-                        ft.dropdown.Option("upper left", "Upper Left"),
-                        ft.dropdown.Option("lower left", "Lower Left"),
-                        ft.dropdown.Option("lower right", "Lower Right"),
-                        ft.dropdown.Option("none", "None"),
-                    ],
+                    options=_dropdown_options(LEGEND_CHOICES),
                     value=self.state.chart_config.legend_position,
                     on_change=self._on_legend_change,
                     height=55,
                     text_size=12,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_DROPDOWN_STYLE,
                 ),
             ),
         ], spacing=10)
@@ -1004,40 +1350,28 @@ class Builder(ft.Container):
     
     def _on_title_change(self, e):
         """Handle title change."""
-        self.state.chart_config.title = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("chart_config.title", e.control.value)
+        self._debounce_render("title")
     
     def _on_subtitle_change(self, e):
         """Handle subtitle change."""
-        self.state.chart_config.subtitle = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("chart_config.subtitle", e.control.value)
+        self._debounce_render("subtitle")
     
     def _on_legend_change(self, e):
         """Handle legend position change."""
-        self.state.chart_config.legend_position = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("chart_config.legend_position", e.control.value)
+        self.on_chart_change()
     
     def _build_annotations_section(self) -> ft.Control:
         """Build annotations section."""
         annotation_type_selector = ft.Dropdown(
-            options=[
-                ft.dropdown.Option("hline", "Horizontal Line"),
-                ft.dropdown.Option("vline", "Vertical Line"),
-                ft.dropdown.Option("text", "Text Label"),
-                ft.dropdown.Option("span", "Horizontal Span"),
-                ft.dropdown.Option("band", "Vertical Band"),
-            ],
+            options=_dropdown_options(ANNOTATION_TYPE_CHOICES),
             value="hline",
             width=180,
             height=55,
             text_size=12,
-            content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-            bgcolor=ft.colors.SURFACE_VARIANT,
-            color=ft.colors.ON_SURFACE,
-            border_color=ft.colors.OUTLINE,
+            **_DROPDOWN_STYLE,
         )
         
         add_btn = ft.ElevatedButton(
@@ -1047,181 +1381,59 @@ class Builder(ft.Container):
             height=35,
         )
         
-        annotations_list = ft.Column(
-            [self._build_annotation_control(ann, i) 
-             for i, ann in enumerate(self.state.chart_config.annotations)],
+        self._annotations_list = ft.Column(
+            [self._build_annotation_control(ann) for ann in self.state.chart_config.annotations],
             spacing=5,
         )
         
         content = ft.Column([
             ft.Row([annotation_type_selector, add_btn], spacing=5),
-            annotations_list,
+            self._annotations_list,
         ], spacing=10)
         
         return Section("Annotations", content, expanded=self.section_expanded.get(6, False))
     
-    def _build_annotation_control(self, annotation: Annotation, index: int) -> ft.Control:
-        """Build control for single annotation."""
-        # Build parameter controls based on annotation type
-        param_controls = []
+    def _build_annotation_control(self, annotation: Annotation) -> ft.Control:
+        """Build control for single annotation.
         
-        if annotation.annotation_type == "hline":
-            param_controls = [
-                LabeledControl(
-                    "Y Value",
-                    ft.TextField(
-                        value=str(annotation.params.get("y", 0)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "y", float(e.control.value) if e.control.value else 0),
-                        height=45,
-                        text_size=12,
-                        width=100,
-                    ),
-                ),
-                LabeledControl(
-                    "Color",
-                    ft.TextField(
-                        value=annotation.params.get("color", "red"),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "color", e.control.value),
-                        height=45,
-                        text_size=12,
-                        width=100,
-                    ),
-                ),
-            ]
-        elif annotation.annotation_type == "vline":
-            param_controls = [
-                LabeledControl(
-                    "X Value",
-                    ft.TextField(
-                        value=str(annotation.params.get("x", 0)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "x", float(e.control.value) if e.control.value else 0),
-                        height=45,
-                        text_size=12,
-                        width=100,
-                    ),
-                ),
-                LabeledControl(
-                    "Color",
-                    ft.TextField(
-                        value=annotation.params.get("color", "red"),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "color", e.control.value),
-                        height=45,
-                        text_size=12,
-                        width=100,
-                    ),
-                ),
-            ]
-        elif annotation.annotation_type == "text":
-            param_controls = [
-                LabeledControl(
-                    "Text",
-                    ft.TextField(
-                        value=annotation.params.get("text", ""),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "text", e.control.value),
-                        height=45,
-                        text_size=12,
-                    ),
-                ),
-                LabeledControl(
-                    "X",
-                    ft.TextField(
-                        value=str(annotation.params.get("x", 0)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "x", float(e.control.value) if e.control.value else 0),
-                        height=45,
-                        text_size=12,
-                        width=80,
-                    ),
-                ),
-                LabeledControl(
-                    "Y",
-                    ft.TextField(
-                        value=str(annotation.params.get("y", 0)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "y", float(e.control.value) if e.control.value else 0),
-                        height=45,
-                        text_size=12,
-                        width=80,
-                    ),
-                ),
-            ]
-        elif annotation.annotation_type == "span":
-            param_controls = [
-                LabeledControl(
-                    "X Min",
-                    ft.TextField(
-                        value=str(annotation.params.get("xmin", 0)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "xmin", float(e.control.value) if e.control.value else 0),
-                        height=45,
-                        text_size=12,
-                        width=80,
-                    ),
-                ),
-                LabeledControl(
-                    "X Max",
-                    ft.TextField(
-                        value=str(annotation.params.get("xmax", 1)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "xmax", float(e.control.value) if e.control.value else 1),
-                        height=45,
-                        text_size=12,
-                        width=80,
-                    ),
-                ),
-                LabeledControl(
-                    "Color",
-                    ft.TextField(
-                        value=annotation.params.get("color", "yellow"),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "color", e.control.value),
-                        height=45,
-                        text_size=12,
-                        width=100,
-                    ),
-                ),
-            ]
-        elif annotation.annotation_type == "band":
-            param_controls = [
-                LabeledControl(
-                    "Y Min",
-                    ft.TextField(
-                        value=str(annotation.params.get("ymin", 0)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "ymin", float(e.control.value) if e.control.value else 0),
-                        height=45,
-                        text_size=12,
-                        width=80,
-                    ),
-                ),
-                LabeledControl(
-                    "Y Max",
-                    ft.TextField(
-                        value=str(annotation.params.get("ymax", 1)),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "ymax", float(e.control.value) if e.control.value else 1),
-                        height=45,
-                        text_size=12,
-                        width=80,
-                    ),
-                ),
+        Handlers hold the annotation itself rather than its index, so rows
+        stay valid when earlier annotations are deleted.
+        """
+        # One labeled field per parameter of this annotation type
+        param_controls = []
+        for key, label, kind, default, width in ANNOTATION_PARAM_FIELDS.get(annotation.annotation_type, ()):
+            commit = partial(self._on_annotation_param_change, annotation, key)
+            if kind is float:
+                value = str(annotation.params.get(key, default))
+                on_change = self._float_handler(commit, empty=default)
+            else:
+                value = annotation.params.get(key, default)
+                on_change = lambda e, commit=commit: commit(e.control.value)
+            param_controls.append(
                 LabeledControl(
-                    "Color",
+                    label,
                     ft.TextField(
-                        value=annotation.params.get("color", "gray"),
-                        on_change=lambda e, idx=index: self._on_annotation_param_change(idx, "color", e.control.value),
+                        value=value,
+                        on_change=on_change,
                         height=45,
                         text_size=12,
-                        width=100,
+                        width=width,
                     ),
-                ),
-            ]
+                )
+            )
         
         return ft.Container(
             content=ft.Column([
                 ft.Row([
                     ft.Checkbox(
                         value=annotation.enabled,
-                        on_change=lambda e, idx=index: self._on_annotation_toggle(e, idx),
+                        on_change=lambda e, ann=annotation: self._on_annotation_toggle(e, ann),
                     ),
                     ft.Text(annotation.annotation_type.upper(), size=12, weight=ft.FontWeight.W_500, expand=True),
                     ft.IconButton(
                         icon=ft.icons.DELETE,
                         icon_size=16,
-                        on_click=lambda _, idx=index: self._on_delete_annotation(idx),
+                        on_click=lambda _, ann=annotation: self._on_delete_annotation(ann),
                     ),
                 ], alignment=ft.MainAxisAlignment.START),
                 ft.Container(
@@ -1247,38 +1459,59 @@ class Builder(ft.Container):
         }
         
         params = default_params.get(annotation_type, {"color": "red"}        )
-        self.state.chart_config.annotations.append(
-            Annotation(annotation_type=annotation_type, params=params)
-        )
+        annotation = Annotation(annotation_type=annotation_type, params=params)
+        self.state.chart_config.annotations.append(annotation)
         self.state.save_snapshot()
-        # Rebuild the annotations section only
-        self._rebuild_section(6)  # Annotations section is at index 6
-        self.on_change()
+        # Append just the new row instead of rebuilding the section
+        self._annotations_list.controls.append(self._build_annotation_control(annotation))
+        with self._suspend_updates():
+            self._update_control(self._annotations_list)
+            self.on_change()
+    
+    def _annotation_index(self, annotation: Annotation) -> Optional[int]:
+        """Find the current position of an annotation in the chart config."""
+        for i, ann in enumerate(self.state.chart_config.annotations):
+            if ann is annotation:
+                return i
+        return None
     
-    def _on_annotation_toggle(self, e, index: int):
+    def _on_annotation_toggle(self, e, annotation: Annotation):
         """Toggle annotation."""
-        self.state.chart_config.annotations[index].enabled = e.control.value
-        self.state.save_snapshot()
-        # Rebuild to show/hide parameter controls
-        self._rebuild_section(6)
-        self.on_change()
+        index = self._annotation_index(annotation)
+        if index is None:
+            return
+        
+        self._edit(f"chart_config.annotations.{index}.enabled", e.control.value)
+        # Show/hide the parameter controls of this row only
+        row = self._annotations_list.controls[index]
+        params_container = row.content.controls[1]
+        params_container.visible = annotation.enabled
+        with self._suspend_updates():
+            self._update_control(params_container)
+            self.on_chart_change()
     
-    def _on_annotation_param_change(self, index: int, param_name: str, value):
+    def _on_annotation_param_change(self, annotation: Annotation, param_name: str, value):
         """Handle annotation parameter change."""
-        try:
-            self.state.chart_config.annotations[index].params[param_name] = value
-            self.state.save_snapshot()
-            self.on_change()
-        except (IndexError, KeyError):
-            pass
+        index = self._annotation_index(annotation)
+        if index is None:
+            return
+        
+        self._edit(f"chart_config.annotations.{index}.params.{param_name}", value)
+        self._debounce_render(f"ann_{index}_{param_name}")
     
-    def _on_delete_annotation(self, index: int):
+    def _on_delete_annotation(self, annotation: Annotation):
         """Delete annotation."""
+        index = self._annotation_index(annotation)
+        if index is None:
+            return
+        
         self.state.chart_config.annotations.pop(index)
         self.state.save_snapshot()
-        # Rebuild the annotations section only
-        self._rebuild_section(6)  # Annotations section is at index 6
-        self.on_change()
+        # Drop just this row; the others find their annotations by identity
+        self._annotations_list.controls.pop(index)
+        with self._suspend_updates():
+            self._update_control(self._annotations_list)
+            self.on_change()
     
     def _build_theme_section(self) -> ft.Control:
         """Build theme configuration."""
@@ -1286,18 +1519,12 @@ class Builder(ft.Container):
             LabeledControl(
                 "Mode",
                 ft.Dropdown(
-                    options=[
-                        ft.dropdown.Option("light", "Light"),
-                        ft.dropdown.Option("dark", "Dark"),
-                    ],
+                    options=_dropdown_options(THEME_MODE_CHOICES),
                     value=self.state.theme.mode,
                     on_change=self._on_theme_mode_change,
                     height=55,
                     text_size=12,
-                    content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
-                    bgcolor=ft.colors.SURFACE_VARIANT,
-                    color=ft.colors.ON_SURFACE,
-                    border_color=ft.colors.OUTLINE,
+                    **_DROPDOWN_STYLE,
                 ),
             ),
             LabeledControl(
@@ -1316,15 +1543,26 @@ class Builder(ft.Container):
     
     def _on_theme_mode_change(self, e):
         """Handle theme mode change."""
-        self.state.theme.mode = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("theme.mode", e.control.value)
+        self.on_chart_change()
     
     def _on_font_size_change(self, e):
         """Handle font size change."""
-        self.state.theme.font_size = e.control.value
-        self.state.save_snapshot()
-        self.on_change()
+        self._edit("theme.font_size", e.control.value)
+        self.on_chart_change()
+    
+    def _on_cell_edit_dispatch(self, e):
+        """Dispatch a cell edit using the (row, col) stored on the control."""
+        row_idx, col_idx = e.control.data
+        self._on_cell_edit(e, row_idx, col_idx)
+    
+    def _on_column_rename_dispatch(self, e):
+        """Dispatch a header edit using the column index stored on the control."""
+        self._on_column_rename(e, e.control.data)
+    
+    def _on_delete_column_dispatch(self, e):
+        """Dispatch a delete column click."""
+        self._on_delete_column(e.control.data)
     
     def _on_cell_edit(self, e, row_idx: int, col_idx: int):
         """Handle cell value edit."""
@@ -1332,12 +1570,12 @@ class Builder(ft.Container):
             return
         
         try:
+            df = self.state.data_source.df
             new_value = e.control.value
-            col_name = self.state.data_source.df.columns[col_idx]
             
             # Try to infer and convert the type
             if new_value == "":
-                self.state.data_source.df.iloc[row_idx, col_idx] = None
+                converted_value = None
             else:
                 # Try numeric conversion
                 try:
@@ -1345,13 +1583,37 @@ class Builder(ft.Container):
                         converted_value = float(new_value)
                     else:
                         converted_value = int(new_value)
-                    self.state.data_source.df.iloc[row_idx, col_idx] = converted_value
                 except ValueError:
                     # Keep as string
-                    self.state.data_source.df.iloc[row_idx, col_idx] = new_value
+                    converted_value = new_value
             
-            self.state.save_snapshot()
-            self.on_change()
+            # Blur after submit, or tabbing through cells, re-sends unchanged values;
+            # writing them would still invalidate snapshots and the render cache
+            old_value = df.iat[row_idx, col_idx]
+            if pd.isna(old_value) or converted_value is None:
+                # pd.NA == x is itself NA, so missing cells never compare by value
+                is_noop = pd.isna(old_value) and converted_value is None
+            else:
+                is_noop = bool(old_value == converted_value)
+            if is_noop:
+                return
+            
+            self._begin_df_edit()
+            old_dtype = df.dtypes.iat[col_idx]
+            # A view for numpy dtypes; still holds the old values if the edit upcasts
+            old_values = df.iloc[:, col_idx].to_numpy()
+            df.iat[row_idx, col_idx] = converted_value
+            
+            # Record a cell diff for undo instead of snapshotting the whole frame
+            self.state.record_cell_diff(
+                row_idx,
+                col_idx,
+                old_value,
+                converted_value,
+                old_values=old_values if df.dtypes.iat[col_idx] != old_dtype else None,
+                merge=self._should_coalesce(("cell", row_idx, col_idx)),
+            )
+            self.on_chart_change()
         except Exception as ex:
             print(f"Error editing cell: {ex}")
     
@@ -1363,25 +1625,23 @@ class Builder(ft.Container):
         import pandas as pd
         import numpy as np
         
+        df = self.state.data_source.df
+        
         # Create a new row with default values (0 for numeric, empty string for others)
-        new_row = {}
-        for col in self.state.data_source.df.columns:
-            dtype = self.state.data_source.df[col].dtype
-            if pd.api.types.is_numeric_dtype(dtype):
-                new_row[col] = 0
-            else:
-                new_row[col] = ""
+        defaults = np.full(len(df.columns), "", dtype=object)
+        defaults[df.dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)] = 0
+        # One row frame typed per column, so numeric columns keep their dtype
+        new_row = pd.DataFrame([defaults], columns=df.columns).infer_objects()
         
         # Append the new row
-        self.state.data_source.df = pd.concat(
-            [self.state.data_source.df, pd.DataFrame([new_row])],
-            ignore_index=True
-        )
+        self.state.data_source.df = pd.concat([df, new_row], ignore_index=True)
         
         self.state.save_snapshot()
-        # Rebuild data editor to show new row
-        self._rebuild_section(1)
-        self.on_change()
+        # Show the new row without rebuilding the data editor
+        with self._suspend_updates():
+            if not self._sync_editor_rows():
+                self._rebuild_section(1)
+            self.on_change()
     
     def _on_delete_row(self, e):
         """Delete the last row from the data."""
@@ -1392,31 +1652,36 @@ class Builder(ft.Container):
         self.state.data_source.df = self.state.data_source.df.iloc[:-1]
         
         self.state.save_snapshot()
-        # Rebuild data editor to reflect deletion
-        self._rebuild_section(1)
-        self.on_change()
+        # Drop the last row without rebuilding the data editor
+        with self._suspend_updates():
+            if not self._sync_editor_rows():
+                self._rebuild_section(1)
+            self.on_change()
     
     def _on_add_column(self, e):
         """Add a new column to the data."""
         if self.state.data_source is None:
             return
         
-        # Find a unique column name
+        # Find a unique column name, probing a set of the current names
+        existing = set(self.state.data_source.df.columns)
         base_name = "NewColumn"
         col_name = base_name
         counter = 1
-        while col_name in self.state.data_source.df.columns:
+        while col_name in existing:
             col_name = f"{base_name}{counter}"
             counter += 1
         
         # Add the column with default value 0
+        self._begin_df_edit()
         self.state.data_source.df[col_name] = 0
         
         self.state.save_snapshot()
         # Rebuild data editor and series section to show new column
-        self._rebuild_section(1)
-        self._rebuild_section(3)
-        self.on_change()
+        with self._suspend_updates():
+            self._rebuild_section(1)
+            self._rebuild_section(3)
+            self.on_change()
     
     def _on_delete_column(self, col_idx: int):
         """Delete a column from the data."""
@@ -1429,14 +1694,15 @@ class Builder(ft.Container):
         if len(self.state.data_source.df.columns) <= 1:
             return
         
-        # Remove column
-        self.state.data_source.df = self.state.data_source.df.drop(columns=[col_name])
+        # Remove column in place; drop() would copy every remaining column
+        self._begin_df_edit()
+        del self.state.data_source.df[col_name]
         
-        # Remove any series that used this column
-        self.state.chart_config.series_styles = [
-            s for s in self.state.chart_config.series_styles 
-            if s.column != col_name
-        ]
+        # Remove any series that used this column, in place and back to front
+        styles = self.state.chart_config.series_styles
+        for i in range(len(styles) - 1, -1, -1):
+            if styles[i].column == col_name:
+                del styles[i]
         
         # Update X column if it was deleted
         if self.state.chart_config.x_column == col_name:
@@ -1444,9 +1710,10 @@ class Builder(ft.Container):
         
         self.state.save_snapshot()
         # Rebuild data editor and series section
-        self._rebuild_section(1)
-        self._rebuild_section(3)
-        self.on_change()
+        with self._suspend_updates():
+            self._rebuild_section(1)
+            self._rebuild_section(3)
+            self.on_change()
     
     def _on_column_rename(self, e, col_idx: int):
         """Rename a column."""
@@ -1465,19 +1732,9 @@ class Builder(ft.Container):
             e.control.value = old_name
             return
         
-        # Rename the column
-        self.state.data_source.df = self.state.data_source.df.rename(columns={old_name: new_name})
-        
-        # Update series that used this column
-        for series in self.state.chart_config.series_styles:
-            if series.column == old_name:
-                series.column = new_name
-        
-        # Update X column if it was renamed
-        if self.state.chart_config.x_column == old_name:
-            self.state.chart_config.x_column = new_name
-        
-        self.state.save_snapshot()
+        # Renames in place, with series and X column references, as one undo step
+        self.state.rename_column(col_idx, new_name)
+        self._numeric_cols_cache = None
         # Rebuild series section to show updated column names
         self._rebuild_section(3)
         self.on_change()
@@ -1503,48 +1760,39 @@ class Builder(ft.Container):
         6 = Annotations
         7 = Theme & Styling
         """
+        # Data may have changed since the last build pass
+        self._cached_df = None
+        
         # Preserve the current expansion state before rebuilding
         if section_index < len(self.sections_column.controls):
             current_section = self.sections_column.controls[section_index]
             if hasattr(current_section, 'is_expanded'):
                 self.section_expanded[section_index] = current_section.is_expanded
         
-        section_builders = [
-            self._build_data_section,
-            self._build_data_preview_section,
-            self._build_chart_type_section,
-            self._build_series_section,
-            self._build_axes_section,
-            self._build_layout_section,
-            self._build_annotations_section,
-            self._build_theme_section,
-        ]
-        
-        if 0 <= section_index < len(section_builders):
+        if 0 <= section_index < len(self._section_builders):
             # Rebuild the specific section
-            self.sections_column.controls[section_index] = section_builders[section_index]()
+            title, build = self._section_builders[section_index]
+            self.sections_column.controls[section_index] = self._build_lazy_section(section_index, title, build)
             # Update only the sections column
-            self.sections_column.update()
+            self._update_control(self.sections_column)
     
-    def refresh(self):
-        """Refresh builder UI with current state."""
+    def refresh(self, batch: bool = False):
+        """Refresh builder UI with current state.
+        
+        With batch, the caller sends the UI update, e.g. one page update per event.
+        """
+        self._cached_df = None
+        # Pending commits refer to controls and state being replaced
+        self._debouncer.cancel()
+        
         # Preserve expansion states before refresh
         for i, section in enumerate(self.sections_column.controls):
             if hasattr(section, 'is_expanded'):
                 self.section_expanded[i] = section.is_expanded
         
         # Rebuild all sections with current state
-        self.sections_column.controls = [
-            self._build_data_section(),
-            self._build_data_preview_section(),
-            self._build_chart_type_section(),
-            self._build_series_section(),
-            self._build_axes_section(),
-            self._build_layout_section(),
-            self._build_annotations_section(),
-            self._build_theme_section(),
-        ]
+        self.sections_column.controls = self._build_sections()
         
-        if hasattr(self.sections_column, 'update'):
+        if not batch and hasattr(self.sections_column, 'update'):
             self.sections_column.update()
 
@@ -2,11 +2,32 @@
 
 import flet as ft
 from typing import Optional
+from collections import OrderedDict
 import io
-import base64
+import threading
+import weakref
 
 from ..models.state import AppState
 from ..charts.mpl_renderer import MatplotlibRenderer
+from .debounce import Debouncer
+
+
+# Rendered previews kept for reuse, most recently shown last
+RENDER_CACHE_SIZE = 8
+# Milliseconds render requests are collected before one render runs
+RENDER_DEBOUNCE_MS = 150
+# Previews are rasterized at screen resolution with cheap PNG compression;
+# exports keep their own DPI
+PREVIEW_DPI = 72
+PREVIEW_PNG_COMPRESS_LEVEL = 1
+
+# (format, label) entries of the export menu
+EXPORT_CHOICES = (
+    ("png", "Export PNG"),
+    ("svg", "Export SVG"),
+    ("pdf", "Export PDF"),
+    ("csv", "Export Data (CSV)"),
+)
 
 
 class Canvas(ft.Container):
@@ -22,6 +43,12 @@ class Canvas(ft.Container):
         self.on_export = on_export
         self.renderer = MatplotlibRenderer()
         self.current_metadata = {}
+        # Render fingerprint -> (weakref to source df, base64 PNG, metadata)
+        self._render_cache = OrderedDict()
+        # Bursts of render requests collapse into one; the lock keeps renders
+        # fired from timer threads from overlapping on the shared renderer
+        self._debouncer = Debouncer()
+        self._render_lock = threading.Lock()
         
         # Build UI
         self.chart_image = ft.Image(
@@ -40,6 +67,8 @@ class Canvas(ft.Container):
             alignment=ft.alignment.center,
         )
         
+        # Text the status bar shows for the last successful render, see _update_status
+        self._last_status_text = None
         self.status_bar = ft.Container(
             content=ft.Row([
                 ft.Text("Ready", size=11),
@@ -85,22 +114,8 @@ class Canvas(ft.Container):
                         icon=ft.icons.DOWNLOAD,
                         tooltip="Export",
                         items=[
-                            ft.PopupMenuItem(
-                                text="Export PNG",
-                                on_click=lambda _: self.on_export("png"),
-                            ),
-                            ft.PopupMenuItem(
-                                text="Export SVG",
-                                on_click=lambda _: self.on_export("svg"),
-                            ),
-                            ft.PopupMenuItem(
-                                text="Export PDF",
-                                on_click=lambda _: self.on_export("pdf"),
-                            ),
-                            ft.PopupMenuItem(
-                                text="Export Data (CSV)",
-                                on_click=lambda _: self.on_export("csv"),
-                            ),
+                            ft.PopupMenuItem(text=label, data=fmt, on_click=self._on_export_click)
+                            for fmt, label in EXPORT_CHOICES
                         ],
                     ),
                 ], spacing=0),
@@ -109,30 +124,81 @@ class Canvas(ft.Container):
             padding=10,
         )
     
+    def _on_export_click(self, e):
+        """Dispatch an export menu click to on_export with its format."""
+        self.on_export(e.control.data)
+    
+    def _render_key(self) -> Optional[tuple]:
+        """Fingerprint everything a preview depends on, or None without data."""
+        source = self.state.data_source
+        if source is None or source.df is None:
+            return None
+        
+        return (
+            id(source.df),
+            self.state.data_version,
+            repr(self.state.transforms),
+            repr(self.state.chart_config),
+            repr(self.state.theme),
+        )
+    
+    def _cached_render(self, key: Optional[tuple]) -> Optional[tuple]:
+        """Return the cached (base64 PNG, metadata) for key, if still valid."""
+        entry = self._render_cache.get(key) if key is not None else None
+        # The id in the key may have been reused by a new frame
+        if entry is None or entry[0]() is not self.state.data_source.df:
+            return None
+        
+        self._render_cache.move_to_end(key)
+        return entry[1], entry[2]
+    
     def render(self):
-        """Render the chart."""
+        """Render the chart once requests stop arriving for RENDER_DEBOUNCE_MS."""
+        self._debouncer.run("render", RENDER_DEBOUNCE_MS, self.render_now)
+    
+    def render_now(self):
+        """Render the chart immediately."""
+        with self._render_lock:
+            self._render()
+    
+    def _render(self):
+        """Render the chart or show why it cannot be rendered."""
         try:
-            # Get transformed data
-            df = self.state.get_transformed_data()
-            
-            if df is None or len(df) == 0:
-                self._show_placeholder("No data to display")
-                return
-            
-            # Render chart
-            fig, metadata = self.renderer.render(
-                df,
-                self.state.chart_config,
-                self.state.theme,
-            )
+            key = self._render_key()
+            cached = self._cached_render(key)
+            if cached is not None:
+                img_base64, metadata = cached
+            else:
+                # Get transformed data
+                df = self.state.get_transformed_data()
+                
+                if df is None or len(df) == 0:
+                    self._show_placeholder("No data to display")
+                    return
+                
+                # Render chart
+                fig, metadata = self.renderer.render(
+                    df,
+                    self.state.chart_config,
+                    self.state.theme,
+                )
+                
+                # Convert to base64 image for display
+                img_base64 = self.renderer.save_to_base64(
+                    format='png',
+                    dpi=PREVIEW_DPI,
+                    compress_level=PREVIEW_PNG_COMPRESS_LEVEL,
+                )
+                
+                # Clean up
+                self.renderer.close()
+                
+                if key is not None:
+                    self._render_cache[key] = (weakref.ref(self.state.data_source.df), img_base64, metadata)
+                    if len(self._render_cache) > RENDER_CACHE_SIZE:
+                        self._render_cache.popitem(last=False)
             
             self.current_metadata = metadata
-            
-            # Convert to image
-            img_bytes = self.renderer.save_to_bytes(format='png', dpi=100)
-            
-            # Convert to base64 for display
-            img_base64 = base64.b64encode(img_bytes).decode()
             self.chart_image.src_base64 = img_base64
             self.chart_image.visible = True
             self.placeholder_text.visible = False
@@ -140,9 +206,6 @@ class Canvas(ft.Container):
             # Update status bar
             self._update_status(metadata)
             
-            # Clean up
-            self.renderer.close()
-            
             # Update UI
             if hasattr(self, 'update'):
                 self.update()
@@ -154,6 +217,7 @@ class Canvas(ft.Container):
         """Show placeholder message."""
         self.chart_image.visible = False
         self.placeholder_text.visible = True
+        self._last_status_text = None
         self.status_bar.content = ft.Row([
             ft.Icon(ft.icons.INFO_OUTLINE, size=16),
             ft.Text(message, size=11),
@@ -166,6 +230,7 @@ class Canvas(ft.Container):
         """Show error message."""
         self.chart_image.visible = False
         self.placeholder_text.visible = True
+        self._last_status_text = None
         self.status_bar.content = ft.Row([
             ft.Icon(ft.icons.ERROR_OUTLINE, size=16, color=ft.colors.ERROR),
             ft.Text(f"Error: {error}", size=11, color=ft.colors.ERROR),
@@ -175,7 +240,7 @@ class Canvas(ft.Container):
             self.update()
     
     def _update_status(self, metadata: dict):
-        """Update status bar with metadata."""
+        """Update status bar with metadata; the caller sends the UI update."""
         rows = metadata.get("rows", 0)
         render_time = metadata.get("render_time", 0)
         warnings = metadata.get("warnings", [])
@@ -185,16 +250,23 @@ class Canvas(ft.Container):
         if warnings:
             status_text += f" • {len(warnings)} warning(s)"
         
+        # Cached renders repeat the last status; keep the existing controls
+        if status_text == self._last_status_text:
+            return
+        self._last_status_text = status_text
+        
         self.status_bar.content = ft.Row([
             ft.Icon(ft.icons.CHECK_CIRCLE, size=16, color=ft.colors.GREEN),
             ft.Text(status_text, size=11),
         ])
-        
-        if hasattr(self, 'update'):
-            self.update()
     
     def export_image(self, file_path: str, format: str = "png", dpi: int = 300):
         """Export current chart to file."""
+        with self._render_lock:
+            return self._export_image(file_path, dpi)
+    
+    def _export_image(self, file_path: str, dpi: int):
+        """Render and save the chart, holding the renderer."""
         try:
             df = self.state.get_transformed_data()
             
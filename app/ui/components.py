@@ -1,19 +1,33 @@
 """Reusable UI components."""
 
+import re
 import flet as ft
 from typing import Callable, Optional, List, Any
 
 
+# Complete #RRGGBB colors; partial input while typing does not match
+HEX_COLOR_RE = re.compile(r"#[0-9A-Fa-f]{6}")
+
+
 class Section(ft.Container):
     """Collapsible section container."""
     
     def __init__(
         self,
         title: str,
-        content: ft.Control,
+        content: Optional[ft.Control] = None,
         expanded: bool = True,
+        content_factory: Optional[Callable[[], ft.Control]] = None,
         **kwargs
     ):
+        # Without content, content_factory builds it on first expansion
+        self._content_factory = None
+        if content is None and content_factory is not None:
+            if expanded:
+                content = content_factory()
+            else:
+                self._content_factory = content_factory
+        
         self.title_text = title
         self.content_control = content
         self.is_expanded = expanded
@@ -55,7 +69,18 @@ class Section(ft.Container):
         icon = self.header.content.controls[0]
         icon.name = ft.icons.EXPAND_MORE if self.is_expanded else ft.icons.CHEVRON_RIGHT
         
-        self.update()
+        if self.is_expanded and self._content_factory is not None:
+            factory, self._content_factory = self._content_factory, None
+            self.set_content(factory())
+        
+        # Only the icon and body changed; skip diffing the rest of the section
+        if self.page is not None:
+            self.page.update(icon, self.body)
+    
+    def set_content(self, content: ft.Control):
+        """Replace the section body content."""
+        self.content_control = content
+        self.body.content = content
 
 
 class LabeledControl(ft.Row):
@@ -98,6 +123,9 @@ class LabeledControl(ft.Row):
 class DataTable(ft.Container):
     """Simple data table component."""
     
+    ROW_EXTENT = 25  # 11px text + 5px padding on each side
+    ROW_BATCH = 10
+    
     def __init__(
         self,
         columns: List[str],
@@ -121,27 +149,20 @@ class DataTable(ft.Container):
             for col in columns
         ], spacing=1)
         
-        # Create rows
-        row_controls = []
-        for row_idx, row_data in enumerate(rows[:50]):  # Limit to 50 rows for performance
-            row_cells = []
-            for col_idx, cell_value in enumerate(row_data):
-                row_cells.append(
-                    ft.Container(
-                        content=ft.Text(str(cell_value), size=11),
-                        padding=5,
-                        expand=True,
-                        bgcolor=ft.colors.SURFACE if row_idx % 2 == 0 else None,
-                    )
-                )
-            row_controls.append(ft.Row(row_cells, spacing=1))
+        # Rows are built on demand: enough to fill the viewport, then more as it scrolls
+        initial = min(len(rows), height // self.ROW_EXTENT + self.ROW_BATCH)
+        self.rows_view = ft.ListView(
+            controls=[self._build_row(i) for i in range(initial)],
+            item_extent=self.ROW_EXTENT,
+            spacing=1,
+            height=height,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+        )
         
         content = ft.Column([
             header,
-            ft.Container(
-                content=ft.Column(row_controls, spacing=1, scroll=ft.ScrollMode.AUTO),
-                height=height,
-            ),
+            self.rows_view,
         ], spacing=1)
         
         super().__init__(
@@ -150,6 +171,29 @@ class DataTable(ft.Container):
             border_radius=4,
             **kwargs
         )
+    
+    def _build_row(self, row_idx: int) -> ft.Control:
+        """Build the control for one data row, zebra striped as a whole."""
+        return ft.Container(
+            content=ft.Row([
+                ft.Container(
+                    content=ft.Text(str(cell_value), size=11),
+                    padding=5,
+                    expand=True,
+                )
+                for cell_value in self.data_rows[row_idx]
+            ], spacing=1),
+            bgcolor=ft.colors.SURFACE if row_idx % 2 == 0 else None,
+        )
+    
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        """Build the next batch of rows when scrolled near the end."""
+        rows = self.rows_view.controls
+        built = len(rows)
+        if built < len(self.data_rows) and e.pixels >= e.max_scroll_extent - self.ROW_EXTENT * 5:
+            end = min(built + self.ROW_BATCH, len(self.data_rows))
+            rows.extend(self._build_row(i) for i in range(built, end))
+            self.rows_view.update()
 
 
 class ColorPicker(ft.Container):
@@ -189,9 +233,13 @@ class ColorPicker(ft.Container):
         )
     
     def _on_text_change(self, e):
-        """Handle text field change."""
-        self.color_value = e.control.value
-        self.color_display.bgcolor = e.control.value
+        """Apply a typed color once it is a complete, new #RRGGBB value."""
+        value = e.control.value.strip()
+        if not HEX_COLOR_RE.fullmatch(value) or value == self.color_value:
+            return
+        
+        self.color_value = value
+        self.color_display.bgcolor = value
         self.color_display.update()
         
         if self.on_change_callback:
@@ -0,0 +1,58 @@
+"""Keyed debouncing for bursty UI events."""
+
+import threading
+from typing import Callable, Dict, Optional
+
+
+class Debouncer:
+    """Run a callable once calls for the same key stop arriving."""
+    
+    def __init__(self):
+        self._timers: Dict[str, threading.Timer] = {}
+        self._calls: Dict[str, Callable] = {}
+        self._lock = threading.Lock()
+    
+    def run(self, key: str, delay_ms: float, fn: Callable) -> None:
+        """Schedule fn for key, replacing any call still pending for it."""
+        with self._lock:
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(delay_ms / 1000, self._fire, args=(key,))
+            timer.daemon = True
+            self._timers[key] = timer
+            self._calls[key] = fn
+            timer.start()
+    
+    def _fire(self, key: str) -> None:
+        """Run the pending call for key from its timer."""
+        with self._lock:
+            if self._timers.get(key) is not threading.current_thread():
+                return  # Replaced or flushed meanwhile
+            del self._timers[key]
+            fn = self._calls.pop(key)
+        fn()
+    
+    def flush(self, key: Optional[str] = None) -> None:
+        """Run pending calls now, for one key or all keys."""
+        with self._lock:
+            keys = list(self._timers) if key is None else [key]
+            calls = []
+            for k in keys:
+                timer = self._timers.pop(k, None)
+                if timer is not None:
+                    timer.cancel()
+                    calls.append(self._calls.pop(k))
+        
+        for fn in calls:
+            fn()
+    
+    def cancel(self, key: Optional[str] = None) -> None:
+        """Drop pending calls without running them, for one key or all keys."""
+        with self._lock:
+            keys = list(self._timers) if key is None else [key]
+            for k in keys:
+                timer = self._timers.pop(k, None)
+                if timer is not None:
+                    timer.cancel()
+                    self._calls.pop(k, None)
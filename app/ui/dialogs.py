@@ -11,15 +11,22 @@ class FilePickerDialog:
         self.page = page
         self.on_result: Optional[Callable] = None
         
-        self.file_picker = ft.FilePicker(
-            on_result=self._handle_result,
-        )
-        
-        page.overlay.append(self.file_picker)
+        # One picker per page: whichever helper opens it last takes over its results
+        for control in page.overlay:
+            if isinstance(control, ft.FilePicker) and control.data is FilePickerDialog:
+                self.file_picker = control
+                break
+        else:
+            self.file_picker = ft.FilePicker(
+                on_result=self._handle_result,
+                data=FilePickerDialog,
+            )
+            page.overlay.append(self.file_picker)
     
     def pick_file(self, allowed_extensions: list, on_result: Callable):
         """Show file picker."""
         self.on_result = on_result
+        self.file_picker.on_result = self._handle_result
         self.file_picker.pick_files(
             allowed_extensions=allowed_extensions,
             allow_multiple=False,
@@ -28,6 +35,7 @@ class FilePickerDialog:
     def save_file(self, file_name: str, on_result: Callable):
         """Show save file dialog."""
         self.on_result = on_result
+        self.file_picker.on_result = self._handle_result
         self.file_picker.save_file(
             file_name=file_name,
         )
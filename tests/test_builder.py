@@ -0,0 +1,62 @@
+"""Tests for builder cell editing."""
+
+import flet as ft
+import pandas as pd
+
+from app.models.state import AppState
+from app.models.data_models import DataSource
+from app.ui.builder import Builder
+
+
+class _Event:
+    """Minimal stand-in for a TextField change event."""
+    
+    def __init__(self, value):
+        self.control = type("Control", (), {"value": value})()
+
+
+class TestCellEdit:
+    """Test editing data cells through the builder."""
+    
+    def setup_method(self):
+        """Setup a builder over a nullable integer column."""
+        self.state = AppState()
+        self.state.data_source = DataSource(
+            name="Test",
+            df=pd.DataFrame({'A': pd.array([1, None, 3], dtype="Int64")}),
+        )
+        self.state.save_snapshot()
+        self.builder = Builder(
+            state=self.state,
+            on_change=lambda: None,
+            on_load_example=lambda name: None,
+            on_import_data=lambda data: None,
+        )
+    
+    def test_edit_na_cell(self, monkeypatch):
+        """Test that a missing cell can be edited and undone."""
+        monkeypatch.setattr(ft.Control, "update", lambda self: None)
+        self.builder._on_cell_edit(_Event("7"), 1, 0)
+        
+        assert self.state.data_source.df['A'].tolist() == [1, 7, 3]
+        assert self.state.undo()
+        assert pd.isna(self.state.data_source.df['A'].iloc[1])
+    
+    def test_clearing_na_cell_is_noop(self, monkeypatch):
+        """Test that clearing an already missing cell records nothing."""
+        monkeypatch.setattr(ft.Control, "update", lambda self: None)
+        self.builder._on_cell_edit(_Event(""), 1, 0)
+        
+        assert not self.state.can_undo()
+    
+    def test_rename_column(self, monkeypatch):
+        """Test that a rename refreshes the numeric column cache."""
+        monkeypatch.setattr(ft.Control, "update", lambda self: None)
+        df = self.state.data_source.df
+        assert self.builder._numeric_columns(df) == ['A']
+        
+        self.builder._on_column_rename(_Event("B"), 0)
+        
+        assert self.builder._numeric_columns(self.state.data_source.df) == ['B']
+        assert self.state.undo()
+        assert list(self.state.data_source.df.columns) == ['A']
@@ -0,0 +1,46 @@
+"""Tests for keyed debouncing."""
+
+import threading
+
+from app.ui.debounce import Debouncer
+
+
+class TestDebouncer:
+    """Test Debouncer."""
+    
+    def setup_method(self):
+        """Setup debouncer and call log."""
+        self.debouncer = Debouncer()
+        self.calls = []
+        self.done = threading.Event()
+    
+    def _record(self, value):
+        """Record a call."""
+        self.calls.append(value)
+        self.done.set()
+    
+    def test_burst_runs_last_call_once(self):
+        """Test that a burst for one key runs only the last call."""
+        for value in range(5):
+            self.debouncer.run("title", 20, lambda v=value: self._record(v))
+        
+        assert self.done.wait(1.0)
+        assert self.calls == [4]
+    
+    def test_keys_are_independent(self):
+        """Test that different keys don't cancel each other."""
+        self.debouncer.run("x_min", 1000, lambda: self.calls.append("x_min"))
+        self.debouncer.run("x_max", 1000, lambda: self.calls.append("x_max"))
+        self.debouncer.flush()
+        
+        assert sorted(self.calls) == ["x_max", "x_min"]
+    
+    def test_flush_and_cancel(self):
+        """Test flushing one key and cancelling the rest."""
+        self.debouncer.run("a", 1000, lambda: self.calls.append("a"))
+        self.debouncer.run("b", 1000, lambda: self.calls.append("b"))
+        self.debouncer.flush("a")
+        self.debouncer.cancel()
+        self.debouncer.flush()
+        
+        assert self.calls == ["a"]
@@ -1,5 +1,6 @@
 """Tests for chart rendering."""
 
+import base64
 import pytest
 import pandas as pd
 import matplotlib
@@ -12,9 +13,15 @@ from app.models.data_models import ChartConfig, SeriesStyle, Theme, AxisConfig
 class TestMatplotlibRenderer:
     """Test Matplotlib renderer."""
     
+    @pytest.fixture(scope="class", autouse=True)
+    def shared_renderer(self, request):
+        """Share one renderer, and so one reused Figure, across the class."""
+        request.cls.renderer = MatplotlibRenderer()
+        yield
+        del request.cls.renderer
+    
     def setup_method(self):
         """Setup test data."""
-        self.renderer = MatplotlibRenderer()
         self.df = pd.DataFrame({
             'X': [1, 2, 3, 4, 5],
             'Y1': [10, 20, 15, 25, 30],
@@ -23,7 +30,7 @@ class TestMatplotlibRenderer:
         self.theme = Theme()
     
     def teardown_method(self):
-        """Cleanup after each test."""
+        """Release the figure; the next test clears and reuses it."""
         self.renderer.close()
     
     def test_render_line_chart(self):
@@ -182,6 +189,20 @@ class TestMatplotlibRenderer:
         assert len(img_bytes) > 0
         assert img_bytes.startswith(b'\x89PNG')  # PNG signature
     
+    def test_save_to_base64(self):
+        """Test saving figure as base64 text."""
+        config = ChartConfig(
+            chart_type="line",
+            x_column="X",
+            series_styles=[SeriesStyle(column="Y1", visible=True)],
+        )
+        
+        self.renderer.render(self.df, config, self.theme)
+        
+        img_base64 = self.renderer.save_to_base64(format='png', dpi=100)
+        
+        assert base64.b64decode(img_base64) == self.renderer.save_to_bytes(format='png', dpi=100)
+    
     def test_render_empty_data(self):
         """Test rendering with empty data."""
         empty_df = pd.DataFrame()
@@ -0,0 +1,260 @@
+"""Tests for application state and undo/redo history."""
+
+import pytest
+import pandas as pd
+
+from app.models.state import AppState
+from app.models.data_models import DataSource, SeriesStyle
+
+
+class TestAppStateHistory:
+    """Test undo/redo history."""
+    
+    def setup_method(self):
+        """Setup state with data and an initial snapshot."""
+        self.state = AppState()
+        self.state.data_source = DataSource(
+            name="Test",
+            df=pd.DataFrame({'A': [1, 2, 3]}),
+        )
+        self.state.save_snapshot()
+    
+    def test_undo_redo(self):
+        """Test undoing and redoing a change."""
+        self.state.chart_config.title = "Changed"
+        self.state.save_snapshot()
+        
+        assert self.state.undo()
+        assert self.state.chart_config.title == ""
+        
+        assert self.state.redo()
+        assert self.state.chart_config.title == "Changed"
+    
+    def test_snapshots_share_unchanged_df(self):
+        """Test that config-only snapshots reuse the previous frozen df."""
+        self.state.chart_config.title = "Changed"
+        self.state.save_snapshot()
+        self.state.sync_snapshots()
+        
+        first, second = self.state._history
+        assert first.data_source.df is second.data_source.df
+        assert first.data_source.df is not self.state.data_source.df
+        
+        self.state.data_source.df = pd.DataFrame({'A': [4, 5, 6]})
+        self.state.save_snapshot()
+        self.state.sync_snapshots()
+        assert self.state._history[-1].data_source.df is not second.data_source.df
+    
+    def test_snapshots_share_unchanged_config(self):
+        """Test that snapshots reuse frozen config parts that did not change."""
+        self.state.chart_config.title = "Changed"
+        self.state.save_snapshot()
+        
+        first, second = self.state._history
+        assert first.theme is second.theme
+        assert first.chart_config is not second.chart_config
+        assert first.chart_config.title == ""
+        
+        assert self.state.undo()
+        self.state.theme.font_size += 1
+        assert second.theme.font_size == first.theme.font_size
+    
+    def test_in_place_df_edit_breaks_sharing(self):
+        """Test that begin_df_edit keeps later snapshots from reusing a stale df."""
+        self.state.begin_df_edit()
+        self.state.data_source.df['B'] = 0
+        self.state.save_snapshot()
+        
+        assert self.state.undo()
+        assert list(self.state.data_source.df.columns) == ['A']
+        assert self.state.redo()
+        assert list(self.state.data_source.df.columns) == ['A', 'B']
+    
+    def test_rename_column_undo_redo(self):
+        """Test that a rename and the series following it undo as one step."""
+        self.state.chart_config.series_styles.append(SeriesStyle(column='A'))
+        self.state.chart_config.x_column = 'A'
+        self.state.save_snapshot()
+        df = self.state.data_source.df
+        
+        self.state.rename_column(0, 'C')
+        assert self.state.data_source.df is df
+        assert list(df.columns) == ['C']
+        assert self.state.chart_config.series_styles[0].column == 'C'
+        assert self.state.chart_config.x_column == 'C'
+        
+        assert self.state.undo()
+        assert list(self.state.data_source.df.columns) == ['A']
+        assert self.state.chart_config.series_styles[0].column == 'A'
+        assert self.state.chart_config.x_column == 'A'
+        
+        assert self.state.redo()
+        assert list(self.state.data_source.df.columns) == ['C']
+        assert self.state.chart_config.x_column == 'C'
+
+
+class TestAppStateCellDiffs:
+    """Test undo/redo of recorded cell edits."""
+    
+    def setup_method(self):
+        """Setup state with data and an initial snapshot."""
+        self.state = AppState()
+        self.state.data_source = DataSource(
+            name="Test",
+            df=pd.DataFrame({'A': [1, 2, 3], 'B': [1.5, 2.5, 3.5]}),
+        )
+        self.state.save_snapshot()
+    
+    def _edit(self, row, col, value, merge=False):
+        """Apply a cell edit the way the data editor does."""
+        self.state.begin_df_edit()
+        df = self.state.data_source.df
+        old = df.iat[row, col]
+        old_dtype = df.dtypes.iat[col]
+        old_values = df.iloc[:, col].to_numpy()
+        df.iat[row, col] = value
+        changed = df.dtypes.iat[col] != old_dtype
+        self.state.record_cell_diff(
+            row, col, old, value,
+            old_values=old_values if changed else None,
+            merge=merge,
+        )
+    
+    def test_undo_redo_cell_edit(self):
+        """Test undoing and redoing a cell edit without a snapshot."""
+        self._edit(1, 1, 9.5)
+        
+        assert self.state.undo()
+        assert self.state.data_source.df['B'].tolist() == [1.5, 2.5, 3.5]
+        
+        assert self.state.redo()
+        assert self.state.data_source.df['B'].tolist() == [1.5, 9.5, 3.5]
+    
+    def test_undo_restores_dtype(self):
+        """Test that undoing an upcasting edit restores the column dtype."""
+        self._edit(0, 0, None)
+        assert self.state.data_source.df['A'].dtype == 'float64'
+        
+        assert self.state.undo()
+        assert self.state.data_source.df['A'].dtype == 'int64'
+        assert self.state.data_source.df['A'].tolist() == [1, 2, 3]
+    
+    def test_merge_same_cell(self):
+        """Test that merged edits of one cell form a single undo step."""
+        self._edit(0, 0, 5)
+        self._edit(0, 0, 55, merge=True)
+        
+        assert self.state.undo()
+        assert self.state.data_source.df['A'].tolist() == [1, 2, 3]
+        assert not self.state.can_undo()
+    
+    def test_merged_upcast_redo_keeps_dtype(self):
+        """Test that redoing a merged upcasting edit reproduces the edited dtype."""
+        self._edit(0, 0, None)
+        self._edit(0, 0, 5, merge=True)
+        assert self.state.data_source.df['A'].dtype == 'float64'
+        
+        assert self.state.undo()
+        assert self.state.data_source.df['A'].dtype == 'int64'
+        assert self.state.data_source.df['A'].tolist() == [1, 2, 3]
+        
+        assert self.state.redo()
+        assert self.state.data_source.df['A'].dtype == 'float64'
+        assert self.state.data_source.df['A'].tolist() == [5.0, 2.0, 3.0]
+    
+    def test_restore_replays_edits(self):
+        """Test undoing a snapshot that follows cell edits."""
+        self._edit(0, 0, 10)
+        self._edit(2, 1, 0.5)
+        self.state.chart_config.title = "Edited"
+        self.state.save_snapshot()
+        
+        assert self.state.undo()
+        assert self.state.chart_config.title == ""
+        assert self.state.data_source.df['A'].tolist() == [10, 2, 3]
+        assert self.state.data_source.df['B'].tolist() == [1.5, 2.5, 0.5]
+    
+    def test_cell_edit_breaks_df_sharing(self):
+        """Test that a snapshot after a cell edit freezes the edited df."""
+        self._edit(0, 0, 10)
+        self.state.chart_config.title = "Edited"
+        self.state.save_snapshot()
+        self.state.sync_snapshots()
+        
+        base, _, snapshot = self.state._history
+        assert base.data_source.df['A'].tolist() == [1, 2, 3]
+        assert snapshot.data_source.df['A'].tolist() == [10, 2, 3]
+    
+    def test_data_version_tracks_in_place_edits(self):
+        """Test that cell edits and their undo bump the data version."""
+        version = self.state.data_version
+        self._edit(0, 0, 10)
+        assert self.state.data_version > version
+        
+        version = self.state.data_version
+        assert self.state.undo()
+        assert self.state.data_version > version
+    
+    def test_history_limit_keeps_full_base(self):
+        """Test that trimming history never leaves a cell edit as the oldest entry."""
+        self.state._max_history = 3
+        for value in (10, 20, 30):
+            self._edit(0, 0, value)
+        
+        while self.state.undo():
+            pass
+        assert self.state.data_source.df['A'].tolist() == [10, 2, 3]
+
+
+class TestAppStateFieldEdits:
+    """Test undo/redo of recorded config field edits."""
+    
+    def setup_method(self):
+        """Setup state with data, a series and an initial snapshot."""
+        self.state = AppState()
+        self.state.data_source = DataSource(
+            name="Test",
+            df=pd.DataFrame({'A': [1, 2, 3]}),
+        )
+        self.state.chart_config.series_styles.append(SeriesStyle(column='A'))
+        self.state.save_snapshot()
+    
+    def test_undo_redo_field_edit(self):
+        """Test undoing and redoing nested field edits."""
+        assert self.state.set_field("chart_config.x_axis.min_value", 1.0)
+        assert self.state.set_field("chart_config.series_styles.0.label", "Series A")
+        
+        assert self.state.undo()
+        assert self.state.chart_config.series_styles[0].label is None
+        assert self.state.chart_config.x_axis.min_value == 1.0
+        
+        assert self.state.undo()
+        assert self.state.chart_config.x_axis.min_value is None
+        
+        assert self.state.redo()
+        assert self.state.redo()
+        assert self.state.chart_config.series_styles[0].label == "Series A"
+    
+    def test_set_field_noop(self):
+        """Test that setting an unchanged value records nothing."""
+        assert not self.state.set_field("chart_config.title", "")
+        assert not self.state.can_undo()
+    
+    def test_merge_same_field(self):
+        """Test that merged edits of one field form a single undo step."""
+        for title in ("T", "Ti", "Title"):
+            self.state.set_field("chart_config.title", title, merge=True)
+        
+        assert self.state.undo()
+        assert self.state.chart_config.title == ""
+        assert not self.state.can_undo()
+    
+    def test_restore_replays_field_edits(self):
+        """Test undoing a snapshot that follows field edits."""
+        self.state.set_field("chart_config.title", "Edited")
+        self.state.chart_config.series_styles.append(SeriesStyle(column='A'))
+        self.state.save_snapshot()
+        
+        assert self.state.undo()
+        assert len(self.state.chart_config.series_styles) == 1
+        assert self.state.chart_config.title == "Edited"
@@ -36,6 +36,23 @@ class TestTransformEngine:
         assert "sum" in result.columns
         assert result["sum"].tolist() == [11, 22, 33, 44, 55]
     
+    def test_column_math_add_bool(self):
+        """Test that adding bool columns counts them."""
+        df = pd.DataFrame({'P': [True, True, False], 'Q': [True, False, True]})
+        transform = Transform(
+            transform_type="column_math",
+            params={
+                "operation": "add",
+                "columns": ["P", "Q"],
+                "new_column": "count",
+            },
+        )
+        
+        result = self.engine.apply_transform(df, transform)
+        
+        assert result["count"].dtype == np.int64
+        assert result["count"].tolist() == [2, 1, 1]
+    
     def test_column_math_subtract(self):
         """Test column subtraction."""
         transform = Transform(
@@ -67,6 +84,26 @@ class TestTransformEngine:
         assert result["A"].min() == 0.0
         assert result["A"].max() == 1.0
     
+    def test_normalize_keeps_float_dtype(self):
+        """Test that normalizing keeps float32 and nullable float columns' dtypes."""
+        df = pd.DataFrame({
+            'G': np.array([1.0, 4.0, 2.5], dtype=np.float32),
+            'F': pd.array([1.0, None, 3.0], dtype="Float64"),
+            'I': pd.array([1, 3, None], dtype="Int64"),
+        })
+        
+        for method in ("min-max", "z-score"):
+            transform = Transform(
+                transform_type="normalize",
+                params={"method": method, "columns": ["G", "F", "I"]},
+            )
+            result = self.engine.apply_transform(df, transform)
+            
+            assert result["G"].dtype == np.float32
+            assert result["F"].dtype == "Float64"
+            assert result["I"].dtype == "Float64"
+            assert result["F"].isna().tolist() == [False, True, False]
+    
     def test_normalize_zscore(self):
         """Test z-score normalization."""
         transform = Transform(
@@ -99,6 +136,38 @@ class TestTransformEngine:
         # Middle values should be averages
         assert result["A"].iloc[2] == 2.0  # (1+2+3)/3
     
+    def test_smooth_rolling_mean(self):
+        """Test centered rolling mean smoothing."""
+        transform = Transform(
+            transform_type="smooth",
+            params={
+                "method": "rolling_mean",
+                "window": 3,
+                "columns": ["A"],
+            },
+        )
+        
+        result = self.engine.apply_transform(self.df, transform)
+        expected = self.df["A"].rolling(window=3, center=True).mean()
+        
+        pd.testing.assert_series_equal(result["A"], expected)
+    
+    def test_smooth_rolling_mean_large_magnitude(self):
+        """Test that one huge value does not wipe out precision of later windows."""
+        df = pd.DataFrame({'A': [1e16] + [1.0] * 9})
+        transform = Transform(
+            transform_type="smooth",
+            params={
+                "method": "rolling_mean",
+                "window": 3,
+                "columns": ["A"],
+            },
+        )
+        
+        result = self.engine.apply_transform(df, transform)
+        
+        assert result["A"].iloc[2:-1].tolist() == [1.0] * 7
+    
     def test_diff(self):
         """Test difference calculation."""
         transform = Transform(
@@ -145,6 +214,55 @@ class TestTransformEngine:
         assert len(result) == 3
         assert result["A"].tolist() == [3, 4, 5]
     
+    def test_filter_pandas_syntax(self):
+        """Test filtering with query syntax only pandas understands."""
+        transform = Transform(
+            transform_type="filter",
+            params={
+                "query": "A > 1 and B < 50",
+            },
+        )
+        
+        result = self.engine.apply_transform(self.df, transform)
+        
+        assert result["A"].tolist() == [2, 3, 4]
+    
+    def test_filter_float32_matches_query(self):
+        """Test that float32 columns filter exactly as DataFrame.query does."""
+        df = pd.DataFrame({'F': np.array([0.1, 0.2, 0.1, 0.05, 0.3], dtype=np.float32)})
+        transform = Transform(transform_type="filter", params={"query": "F > 0.1"})
+        
+        result = self.engine.apply_transform(df, transform)
+        
+        assert result.index.tolist() == df.query("F > 0.1").index.tolist()
+    
+    def test_filter_invalid_query_falls_back(self):
+        """Test that queries DataFrame.query rejects still leave the rows alone."""
+        for query in ["A & 1 == 1", "A ** -1 < 0"]:
+            transform = Transform(transform_type="filter", params={"query": query})
+            
+            result = self.engine.apply_transform(self.df, transform)
+            
+            assert result["A"].tolist() == [1, 2, 3, 4, 5], query
+    
+    def test_group_sorted_key(self):
+        """Test grouping on an already-sorted key."""
+        df = pd.DataFrame({
+            'Day': [1, 1, 2, 2, 2, 3],
+            'Value': [1.0, 3.0, np.nan, 4.0, 8.0, 5.0],
+        })
+        
+        for agg_func in ["mean", "sum", "count", "min", "max"]:
+            transform = Transform(
+                transform_type="group",
+                params={"group_by": ["Day"], "agg_func": agg_func},
+            )
+            
+            result = self.engine.apply_transform(df, transform)
+            expected = df.groupby(["Day"])[["Value"]].agg(agg_func).reset_index()
+            
+            pd.testing.assert_frame_equal(result, expected)
+    
     def test_computed_series(self):
         """Test computed series."""
         transform = Transform(
@@ -160,6 +278,38 @@ class TestTransformEngine:
         assert "computed" in result.columns
         assert result["computed"].tolist() == [12, 24, 36, 48, 60]
     
+    def test_computed_series_numexpr_matches_eval(self, monkeypatch):
+        """Test that the numexpr path gives the eval path's values and dtypes."""
+        pytest.importorskip("numexpr")
+        from app.services import transforms
+        
+        df = pd.DataFrame({
+            'A': [5, -7, 9, 0],
+            'B': [2, 0, -4, 0],
+            'F': [1.5, -2.0, np.nan, 0.0],
+            'G': np.array([1, 2, 3, 4], dtype=np.float32),
+            'U': np.array([200, 1, 2, 3], dtype=np.uint8),
+        })
+        expressions = [
+            "A * 2 + B", "A / B", "F / B", "-A + F", "A > B", "F <= 0.5",
+            "A % B", "A ** 2", "A << 1", "G + 1.5", "U * 2",
+            "abs(F)", "sqrt(G)", "where(A > 0, A, B)",
+        ]
+        
+        for expression in expressions:
+            transform = Transform(
+                transform_type="computed_series",
+                params={"expression": expression, "new_column": "computed"},
+            )
+            monkeypatch.setattr(transforms, "NUMEXPR_AVAILABLE", True)
+            fast = self.engine.apply_transform(df, transform)
+            monkeypatch.setattr(transforms, "NUMEXPR_AVAILABLE", False)
+            expected = self.engine.apply_transform(df, transform)
+            
+            assert ("computed" in fast) == ("computed" in expected), expression
+            if "computed" in expected:
+                pd.testing.assert_series_equal(fast["computed"], expected["computed"], obj=expression)
+    
     def test_interpolate(self):
         """Test interpolation."""
         df_with_nan = pd.DataFrame({
@@ -180,4 +330,77 @@ class TestTransformEngine:
         assert not result["A"].isna().any()
         assert result["A"].iloc[1] == 2.0
         assert result["A"].iloc[3] == 4.0
+    
+    def test_transform_leaves_input_untouched(self):
+        """Test that shallow-copied results never write into the input frame."""
+        expected = self.df.copy()
+        for transform_type, params in (
+            ("normalize", {"method": "min-max", "columns": ["A", "B"]}),
+            ("pct_change", {"columns": ["C"]}),
+            ("column_math", {"operation": "add", "columns": ["A", "B"], "new_column": "A"}),
+        ):
+            result = self.engine.apply_transform(self.df, Transform(transform_type=transform_type, params=params))
+            assert not result.equals(self.df)
+        
+        pd.testing.assert_frame_equal(self.df, expected)
 
+
+class TestPolarsBackend:
+    """Test that the polars path matches the pandas path on large frames."""
+    
+    @pytest.fixture(scope="class", autouse=True)
+    def shared_data(self, request):
+        """Build test data large enough to take the polars path once for the class."""
+        pytest.importorskip("polars")
+        
+        from app.services.transforms import POLARS_MIN_ROWS
+        
+        rng = np.random.default_rng(0)
+        n = POLARS_MIN_ROWS
+        cls = request.cls
+        cls.fast_engine = TransformEngine(use_polars=True)
+        cls.pandas_engine = TransformEngine(use_polars=False)
+        cls.df = pd.DataFrame({
+            'key': rng.integers(0, 20, n),
+            'A': rng.normal(size=n),
+            'B': rng.integers(1, 100, n),
+            'flag': rng.random(n) > 0.5,
+            'I': pd.array(rng.integers(0, 9, n), dtype="Int64"),
+        })
+        cls.df.loc[[0, 5, 7, 8], 'A'] = np.nan
+        yield
+        del cls.fast_engine, cls.pandas_engine, cls.df
+    
+    def _assert_same(self, transform_type, params):
+        """Apply a transform with both engines and compare results."""
+        transform = Transform(transform_type=transform_type, params=params)
+        
+        fast = self.fast_engine.apply_transform(self.df, transform)
+        expected = self.pandas_engine.apply_transform(self.df, transform)
+        
+        pd.testing.assert_frame_equal(fast, expected)
+    
+    def test_rolling(self):
+        """Test rolling operations."""
+        for operation in ["mean", "sum", "std", "max"]:
+            self._assert_same("rolling", {"window": 5, "operation": operation, "columns": ["A", "B"]})
+            self._assert_same("rolling", {"window": 5, "operation": operation, "columns": ["A", "flag", "I"]})
+    
+    def test_diff_and_pct_change(self):
+        """Test diff and percentage change."""
+        self._assert_same("diff", {"periods": 2, "columns": ["A", "B"]})
+        self._assert_same("diff", {"periods": 2, "columns": ["A", "flag", "I"]})
+        for periods in [1, 3]:
+            self._assert_same("pct_change", {"periods": periods, "columns": ["A", "B"]})
+    
+    def test_normalize(self):
+        """Test min-max, z-score and robust normalization."""
+        for method in ["min-max", "z-score", "robust"]:
+            self._assert_same("normalize", {"method": method, "columns": ["A", "B"]})
+            self._assert_same("normalize", {"method": method, "columns": ["A", "I"]})
+        self._assert_same("normalize", {"method": "min-max", "columns": ["A", "flag"]})
+    
+    def test_group(self):
+        """Test group aggregation."""
+        for agg_func in ["mean", "sum", "count"]:
+            self._assert_same("group", {"group_by": ["key"], "agg_func": agg_func})